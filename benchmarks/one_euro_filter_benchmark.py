@@ -0,0 +1,36 @@
+"""Compare the per-landmark and vectorized OneEuroFilter paths.
+
+Usage: python benchmarks/one_euro_filter_benchmark.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from mediapipe_inferencer_core.data_class import LandmarkList
+from mediapipe_inferencer_core.filter import OneEuroFilter
+
+N_FRAMES = 200
+LANDMARK_COUNTS = {"hand": 21, "pose": 33, "face": 478}
+
+
+def run(n_landmarks: int, vectorized: bool) -> float:
+    rng = np.random.default_rng(0)
+    frames = [LandmarkList.from_array(rng.random((n_landmarks, 4))) for _ in range(N_FRAMES)]
+
+    def filter_frames():
+        one_euro = OneEuroFilter(0.08, 1.0, 1.0, vectorized=vectorized)
+        for i, frame in enumerate(frames):
+            one_euro.filter(frame, 1.0 + i / 60)
+
+    return min(timeit.repeat(filter_frames, number=1, repeat=3)) / N_FRAMES
+
+
+if __name__ == "__main__":
+    print(f"{'stream':<6} {'N':>4} {'per-landmark [ms]':>18} {'vectorized [ms]':>16} {'speedup':>8}")
+    for name, n_landmarks in LANDMARK_COUNTS.items():
+        per_landmark = run(n_landmarks, vectorized=False) * 1000
+        vectorized = run(n_landmarks, vectorized=True) * 1000
+        print(f"{name:<6} {n_landmarks:>4} {per_landmark:>18.3f} {vectorized:>16.3f} {per_landmark / vectorized:>7.1f}x")
@@ -0,0 +1,44 @@
+"""Compare packing MediaPipe landmarks through Landmark objects with the array-native path.
+
+Usage: python benchmarks/pack_landmarks_benchmark.py
+"""
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from mediapipe_inferencer_core.data_class import LandmarkList
+from mediapipe_inferencer_core.packer import pack_to_landmark
+
+N_RUNS = 500
+
+
+@dataclass
+class NormalizedLandmark:
+    """Same fields as mediapipe.tasks.python.components.containers.NormalizedLandmark."""
+    x: float
+    y: float
+    z: float
+    visibility: float = 0.0
+    presence: float = 0.0
+
+
+def pack_with_landmark_objects(raw_landmarks) -> LandmarkList:
+    return LandmarkList([pack_to_landmark.format_landmark(lm) for lm in raw_landmarks])
+
+
+def per_frame_ms(func, raw_landmarks) -> float:
+    return min(timeit.repeat(lambda: func(raw_landmarks), number=N_RUNS, repeat=3)) / N_RUNS * 1000
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    print(f"{'N':>4} {'Landmark objects [ms]':>22} {'array-native [ms]':>18} {'speedup':>8}")
+    for n_landmarks in [21, 33, 478]:
+        raw_landmarks = [NormalizedLandmark(*map(float, rng.random(4))) for _ in range(n_landmarks)]
+        before = per_frame_ms(pack_with_landmark_objects, raw_landmarks)
+        after = per_frame_ms(pack_to_landmark.pack_landmarks, raw_landmarks)
+        print(f"{n_landmarks:>4} {before:>22.3f} {after:>18.3f} {before / after:>7.1f}x")
@@ -0,0 +1,57 @@
+from mediapipe_inferencer_core.filter import FILTER_PARAMETERS
+from mediapipe_inferencer_core.filter.parameter_sweep import sweep, apply_to_config
+from sweep_arg_parser import create_settings_from_args
+
+import json
+from pathlib import Path
+
+DEFAULT_GRIDS = {
+    'one_euro': {
+        'min_cutoff': [0.01, 0.05, 0.08, 0.2, 0.5, 1.0],
+        'slope': [0.1, 0.5, 1.0, 3.0, 6.0, 10.0],
+    },
+    'kalman': {
+        'process_noise': [0.1, 1.0, 10.0, 100.0],
+        'measurement_noise': [1e-5, 1e-4, 1e-3],
+    },
+}
+
+N_REPORTED = 5
+
+
+if __name__ == "__main__":
+    settings = create_settings_from_args()
+    grids = {**DEFAULT_GRIDS[settings.algorithm], **settings.grids}
+    config = {}
+    if Path(settings.settings_path).exists():
+        with open(settings.settings_path) as f:
+            config = json.load(f)
+    results = sweep(
+        settings.recordings,
+        settings.algorithm,
+        grids,
+        settings.groups,
+        reference_sigma=settings.reference_sigma,
+        lag_weight=settings.lag_weight,
+        max_workers=settings.workers,
+        config=config
+    )
+
+    parameter_names = list(FILTER_PARAMETERS[settings.algorithm])
+    best = {}
+    for group, group_results in results.items():
+        if not group_results:
+            print(f"{group}: no recorded frames")
+            continue
+        best[group] = group_results[0]
+        print(f"{group}: {', '.join(parameter_names)} | jitter | lag | score")
+        for result in group_results[:N_REPORTED]:
+            params = ', '.join(f"{value:g}" for value in result.params)
+            print(f"  {params} | {result.jitter:.3e} | {result.lag:.3e} | {result.score:.3f}")
+
+    if settings.write_settings and best:
+        apply_to_config(config, settings.algorithm, best)
+        with open(settings.settings_path, 'w') as f:
+            json.dump(config, f, indent=2)
+            f.write("\n")
+        print(f"Best parameters written to {settings.settings_path}")
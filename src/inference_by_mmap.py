@@ -1,17 +1,23 @@
-from mediapipe_inferencer_core.network import HolisticPoseSender
-from mediapipe_inferencer_core.detector import DetectorHandler, HandDetector, FaceDetector, PoseDetector
+from mediapipe_inferencer_core.network import HolisticPoseSender, OutputScheduler
+from mediapipe_inferencer_core.detector import DetectorHandler, HandDetector, FaceDetector, PoseDetector, LandmarkDetector, ProcessDetector, RoiDetector, HAND_POSE_LANDMARKS, FACE_POSE_LANDMARKS
+from mediapipe_inferencer_core.input_resizer import InputResizer
+from mediapipe_inferencer_core.motion_gate import MotionGate
 from mediapipe_inferencer_core import visualizer
 from mediapipe_inferencer_core.image_provider import MmapImageProvider
-from mediapipe_inferencer_core.filter import OneEuroFilter
+from mediapipe_inferencer_core.filter import FilterBank, ForwardPredictor, BlendshapeFilter, FILTER_PARAMETERS
+from mediapipe_inferencer_core.filter.filter_bank import SEGMENT_GROUPS
+from mediapipe_inferencer_core.landmark_recorder import LandmarkRecorder
+from mediapipe_inferencer_core.data_class import LandmarkBufferPool, HolisticResults
 from mmap_arg_parser import create_settings_from_args
 
 from pathlib import Path
 import cv2
-import copy
 import time
 import signal
 import sys
 import json
+from collections import deque
+from typing import Callable
 
 
 def get_base_directory() -> Path:
@@ -32,17 +38,126 @@ def load_config(base_dir: Path) -> dict:
         return json.load(f)
 
 
-def get_filter_params(config: dict, filter_type: str) -> tuple[float, float, float]:
+def get_filter_algorithm(config: dict) -> str:
+    return config.get("filter", {}).get("algorithm", "one_euro")
+
+
+def get_filter_params(config: dict, filter_type: str) -> tuple[float, ...]:
     filter_config = config.get("filter", {})
     default = filter_config.get("default", {})
     specific = filter_config.get(filter_type, {})
     merged = {**default, **specific}
+    parameters = FILTER_PARAMETERS[get_filter_algorithm(config)]
+    return tuple(merged.get(name, default_value) for name, default_value in parameters.items())
+
+
+def create_blendshape_filter(config: dict) -> BlendshapeFilter:
+    blendshape_config = config.get("blendshapes", {})
+    return BlendshapeFilter(
+        blendshape_config.get("smoothing_factor", 1.0),
+        blendshape_config.get("dead_band", 0.0)
+    )
+
+
+def get_prediction_params(config: dict, prediction_type: str) -> tuple[float, float]:
+    prediction_config = config.get("prediction", {})
+    default = prediction_config.get("default", {})
+    specific = prediction_config.get(prediction_type, {})
+    merged = {**default, **specific}
     return (
-        merged.get("min_cutoff", 1.0),
-        merged.get("slope", 1.0),
-        merged.get("d_min_cutoff", 1.0)
+        merged.get("horizon", 0.0),
+        merged.get("max_displacement", 0.05)
+    )
+
+
+def get_detector_options(config: dict) -> dict:
+    detector_config = config.get("detector", {})
+    return {
+        "wait_budget": detector_config.get("wait_budget", 0.03),
+        "max_in_flight": detector_config.get("max_in_flight", 1),
+        "request_timeout": detector_config.get("request_timeout", 0.5),
+        "partial_updates": detector_config.get("partial_updates", False),
+        "rates": detector_config.get("rates", {}),
+        "frame_intervals": detector_config.get("frame_intervals", {})
+    }
+
+
+def create_detector(config: dict, part: str, detector_class: type, *args) -> LandmarkDetector:
+    detector_config = config.get("detector", {})
+    if not detector_config.get("worker_processes", False):
+        return detector_class(*args)
+    return ProcessDetector(detector_class, *args, cpu_affinity=detector_config.get("cpu_affinity", {}).get(part))
+
+
+def crop_to_pose(config: dict, detector: LandmarkDetector, pose: LandmarkDetector | None, pose_landmarks: range) -> LandmarkDetector:
+    roi_config = config.get("detector", {}).get("roi", {})
+    if pose is None or not roi_config.get("enabled", False):
+        return detector
+    return RoiDetector(detector, pose, pose_landmarks, roi_config.get("padding", 0.5), input_size=roi_config.get("input_size", 256))
+
+
+def create_motion_gate(config: dict) -> MotionGate | None:
+    gate_config = config.get("detector", {}).get("motion_gate", {})
+    if not gate_config.get("enabled", False):
+        return None
+    return MotionGate(gate_config.get("threshold", 3.0), gate_config.get("max_skips", 5),
+                      gate_config.get("step", 8), gate_config.get("regions", True))
+
+
+def create_input_resizer(config: dict) -> InputResizer | None:
+    input_config = config.get("detector", {}).get("input", {})
+    if not input_config.get("enabled", False):
+        return None
+    return InputResizer((input_config["width"], input_config["height"]), input_config.get("letterbox", False))
+
+
+def create_buffer_pool(config: dict) -> LandmarkBufferPool:
+    pool_config = config.get("buffer_pool", {})
+    return LandmarkBufferPool(pool_config.get("capacity", 4), debug=pool_config.get("debug", False))
+
+
+def create_predictor(config: dict, filters: FilterBank, pool: LandmarkBufferPool = None) -> ForwardPredictor | None:
+    prediction_config = config.get("prediction", {})
+    if not prediction_config.get("enabled", False):
+        return None
+    params = {
+        name: get_prediction_params(config, prediction_type)
+        for prediction_type, names in SEGMENT_GROUPS.items() for name in names if name in filters.segments
+    }
+    return ForwardPredictor(filters, params, prediction_config.get("compensate_latency", True), pool)
+
+def create_part_sender(filters: FilterBank, blendshape_filter: BlendshapeFilter, predictor: ForwardPredictor | None,
+                       pose_sender: HolisticPoseSender, pool: LandmarkBufferPool) -> Callable[[HolisticResults], None]:
+    """Filter and send a single part as a partial update, from the callback of its detector.
+
+    The callback runs under the lock of the detector handler, so errors are logged rather than raised into MediaPipe.
+    """
+    def send_part(part_results: HolisticResults) -> None:
+        try:
+            filtered = filters.filter(part_results.snapshot())
+            if filtered.face.blendshapes is not None:
+                filtered.face.blendshapes = blendshape_filter.filter(filtered.face.blendshapes)
+            results = predictor.predict(filtered.snapshot(), time.monotonic()) if predictor is not None else filtered
+            pose_sender.send_holistic_landmarks(results)
+            pool.release_results(filtered, results, keep=part_results)
+        except Exception as error:
+            print(f"Failed to send a partial update: {error!r}", file=sys.stderr)
+    return send_part
+
+
+def create_output_scheduler(config: dict, pose_sender: HolisticPoseSender) -> OutputScheduler | None:
+    output_config = config.get("output", {})
+    rate_hz = output_config.get("rate_hz", 0)
+    if rate_hz <= 0:
+        return None
+    return OutputScheduler(
+        pose_sender.send_holistic_landmarks,
+        rate_hz,
+        delay=output_config.get("delay", 0.0),
+        max_extrapolation=output_config.get("max_extrapolation", 0.05)
     )
 
+
 running = True
 
 def handle_sigint(signum, frame):
@@ -58,14 +173,29 @@ if __name__ == "__main__":
     base_dir = get_base_directory()
     config = load_config(base_dir)
 
-    pose_sender = HolisticPoseSender(config["pose_sender"]["host"], config["pose_sender"]["port"])
+    buffer_pool = create_buffer_pool(config)
+    pose_sender = HolisticPoseSender(config["pose_sender"]["host"], config["pose_sender"]["port"], buffer_pool)
     pose_sender.connect()
+    output_scheduler = create_output_scheduler(config, pose_sender)
+    if output_scheduler is not None:
+        output_scheduler.start()
+
+    detector_options = get_detector_options(config)
+    if detector_options["partial_updates"] and output_scheduler is not None:
+        print("detector.partial_updates is ignored while the output scheduler is enabled", file=sys.stderr)
+        detector_options["partial_updates"] = False
+    partial_updates = detector_options["partial_updates"]
 
     models_dir = str(base_dir / config["models_dir"])
+    pose_detector = create_detector(config, "pose", PoseDetector, models_dir + "/pose_landmarker_full.task", 0.8) if settings.enable_pose_inference else None
     holistic_detector = DetectorHandler(
-        pose=PoseDetector(models_dir + "/pose_landmarker_full.task", 0.8) if settings.enable_pose_inference else None,
-        hand=HandDetector(models_dir + "/hand_landmarker.task", 0.5),
-        face=FaceDetector(models_dir + "/face_landmarker.task", 0.5)
+        pose=pose_detector,
+        hand=crop_to_pose(config, create_detector(config, "hand", HandDetector, models_dir + "/hand_landmarker.task", 0.5), pose_detector, HAND_POSE_LANDMARKS),
+        face=crop_to_pose(config, create_detector(config, "face", FaceDetector, models_dir + "/face_landmarker.task", 0.5), pose_detector, FACE_POSE_LANDMARKS),
+        pool=buffer_pool,
+        motion_gate=create_motion_gate(config),
+        resizer=create_input_resizer(config),
+        **detector_options
     )
 
     height, width = 720, 1280
@@ -78,17 +208,25 @@ if __name__ == "__main__":
 
     hand_params = get_filter_params(config, "hand")
     face_params = get_filter_params(config, "face")
-    filter = {
-        'left_hand_local':  OneEuroFilter(*hand_params),
-        'left_hand_world':  OneEuroFilter(*hand_params),
-        'right_hand_local': OneEuroFilter(*hand_params),
-        'right_hand_world': OneEuroFilter(*hand_params),
-        'face_landmark':    OneEuroFilter(*face_params)
+    filter_params = {
+        'left_hand_local':  hand_params,
+        'left_hand_world':  hand_params,
+        'right_hand_local': hand_params,
+        'right_hand_world': hand_params,
+        'face_landmark':    face_params
         }
     if settings.enable_pose_inference:
         pose_params = get_filter_params(config, "pose")
-        filter['pose_local'] = OneEuroFilter(*pose_params)
-        filter['pose_world'] = OneEuroFilter(*pose_params)
+        filter_params['pose_local'] = pose_params
+        filter_params['pose_world'] = pose_params
+    filter = FilterBank(filter_params, get_filter_algorithm(config), buffer_pool)
+    predictor = create_predictor(config, filter, buffer_pool)
+    blendshape_filter = create_blendshape_filter(config)
+    if partial_updates:
+        holistic_detector.subscribe(create_part_sender(filter, blendshape_filter, predictor, pose_sender, buffer_pool), partial=True)
+
+    # Record raw landmarks for offline filter tuning if path is specified
+    recorder = LandmarkRecorder(settings.record_landmarks_path) if settings.record_landmarks_path else None
 
     # 3D visualizer (lazy import to avoid open3d dependency in standalone build)
     vis3d = None
@@ -96,33 +234,50 @@ if __name__ == "__main__":
         from mediapipe_inferencer_core.visualizer_3d import Pose3DVisualizer
         vis3d = Pose3DVisualizer()
 
+    # The output scheduler keeps interpolating between the last pushed frames
+    frames_in_use = deque()
+    max_frames_in_use = OutputScheduler.FRAMES_IN_USE if output_scheduler is not None else 0
+
+    frame_interval = 1/60
     while running:
+        loop_start = time.monotonic()
+
         # Break in key Ctrl+C pressed
         if cv2.waitKey(5) & 0xFF == 27:
             break
 
-        image = cv2.cvtColor(image_provider.latest_frame, cv2.COLOR_RGBA2BGR)
-        if image is None:
+        # Only prepare a frame if a detector can take it (MediaPipe drops the frames a busy detector gets)
+        image = None
+        if holistic_detector.accepts_frame:
+            image = cv2.cvtColor(image_provider.latest_frame, cv2.COLOR_RGBA2BGR)
+            holistic_detector.inference(image)
+
+        # Wait for the next aggregated frame; it is picked up as soon as the detector callbacks complete it
+        raw_results = holistic_detector.wait_for_results(timeout=frame_interval)
+        if raw_results is None:
             continue
-        holistic_detector.inference(image)
-
-        # Filtering (Note: use copy.deepcopy if you need to filter results)
-        results = copy.deepcopy(holistic_detector.results)
-        time_s = results.time
-        results.hand.left.local = filter['left_hand_local'].filter(results.hand.left.local, time_s)
-        results.hand.left.world = filter['left_hand_world'].filter(results.hand.left.world, time_s)
-        results.hand.right.local = filter['right_hand_local'].filter(results.hand.right.local, time_s)
-        results.hand.right.world = filter['right_hand_world'].filter(results.hand.right.world, time_s)
-        results.face.landmarks = filter['face_landmark'].filter(results.face.landmarks, time_s)
-        if settings.enable_pose_inference:
-            results.pose.local = filter['pose_local'].filter(results.pose.local, time_s)
-            results.pose.world = filter['pose_world'].filter(results.pose.world, time_s)
-
-        # Send results to solver app
-        pose_sender.send_holistic_landmarks(results)
+
+        # Filtering (on snapshots, so the buffers of every stage can be released once the frame is sent)
+        if recorder is not None:
+            recorder.append(raw_results)
+        if partial_updates:
+            # Parts are filtered and sent from the detector callbacks, the loop only visualizes
+            filtered = results = raw_results
+        else:
+            filtered = filter.filter(raw_results.snapshot())
+            filtered.face.blendshapes = blendshape_filter.filter(filtered.face.blendshapes)
+            results = predictor.predict(filtered.snapshot(), time.monotonic()) if predictor is not None else filtered
+
+            # Send results to solver app (at a fixed rate if the output scheduler is enabled)
+            if output_scheduler is not None:
+                output_scheduler.push(results)
+            else:
+                pose_sender.send_holistic_landmarks(results)
 
         # Visualize resulted landmarks
         if settings.enable_visualization_window:
+            if image is None:
+                image = cv2.cvtColor(image_provider.latest_frame, cv2.COLOR_RGBA2BGR)
             annotated_image = image
             if results.pose is not None:
                 annotated_image = visualizer.draw_pose_landmarks_on_image(annotated_image, results.pose)
@@ -137,8 +292,21 @@ if __name__ == "__main__":
         if vis3d is not None:
             vis3d.update(pose_result=results.pose, hand_result=results.hand)
 
-        time.sleep(1/60)
+        # Recycle the landmark buffers of frames nothing reads anymore
+        # (the raw buffers belong to the detector handler, which releases them when it repacks a part)
+        frames_in_use.append((raw_results, filtered, results))
+        while len(frames_in_use) > max_frames_in_use:
+            raw, *derived = frames_in_use.popleft()
+            buffer_pool.release_results(*derived, keep=raw)
+
+        time.sleep(max(0.0, loop_start + frame_interval - time.monotonic()))
 
+    print(f"Detector frames: {holistic_detector.statistics}")
+    holistic_detector.close()
+    if output_scheduler is not None:
+        output_scheduler.stop()
     if vis3d is not None:
         vis3d.close()
+    if recorder is not None:
+        recorder.save()
     cv2.destroyAllWindows()
\ No newline at end of file
@@ -1,3 +1,5 @@
 from .landmark import Landmark
 from .landmark_list import LandmarkList
 from .result_data import *
+from .holistic_frame import HolisticFrame
+from .buffer_pool import LandmarkBufferPool
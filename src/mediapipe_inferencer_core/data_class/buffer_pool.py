@@ -0,0 +1,72 @@
+import threading
+import numpy as np
+from .result_data import HolisticResults, SEGMENT_SIZES, get_segment
+
+
+class LandmarkBufferPool:
+    """Fixed-shape (N, 4) landmark arrays per stream of `SEGMENT_SIZES`, recycled across frames.
+
+    Packing, filtering and sending take their output arrays from the pool and the frame loop
+    releases them once the frame has been sent, so the steady-state loop allocates no landmark arrays.
+    In debug mode released arrays are filled with NaN and made read-only: writing to a released
+    array raises and reading from it yields NaN, which makes a use after release visible.
+    """
+    def __init__(self, capacity:int = 4, dtype = np.float32, debug:bool = False) -> None:
+        """
+        Args:
+            capacity (int): Arrays preallocated per stream. The pool grows if more are in use at once.
+            dtype: Data type of the arrays.
+            debug (bool): Poison released arrays to detect use after release.
+        """
+        self.__dtype = dtype
+        self.__debug = debug
+        self.__free = {name: [self.__allocate(name) for _ in range(capacity)] for name in SEGMENT_SIZES}
+        self.__in_use: dict[int, tuple[str, np.ndarray]] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def in_use(self) -> int:
+        """Number of arrays handed out and not released yet."""
+        return len(self.__in_use)
+
+    def acquire(self, name:str) -> np.ndarray:
+        """Hand out a writable (SEGMENT_SIZES[name], 4) array with undefined contents."""
+        with self.__lock:
+            free = self.__free[name]
+            values = free.pop() if free else self.__allocate(name)
+            self.__in_use[id(values)] = (name, values)
+        values.flags.writeable = True
+        return values
+
+    def release(self, values:np.ndarray) -> None:
+        """Give `values` back to the pool. Arrays that were not handed out by the pool (or already released) are ignored."""
+        with self.__lock:
+            # Arrays in use are referenced by the pool, so no other live array can share their id.
+            entry = self.__in_use.pop(id(values), None)
+            if entry is None:
+                return
+            name = entry[0]
+            if self.__debug:
+                values.flags.writeable = True
+                values.fill(np.nan)
+                values.flags.writeable = False
+            self.__free[name].append(values)
+
+    def release_results(self, *results:HolisticResults, keep:HolisticResults = None) -> None:
+        """Release the landmark arrays of every segment of `results`, except the ones shared with `keep`
+        (e.g. unfiltered segments still owned by the `DetectorHandler`)."""
+        kept = set()
+        for name in SEGMENT_SIZES if keep is not None else ():
+            landmarks = get_segment(keep, name)
+            if landmarks is not None:
+                kept.add(id(landmarks.values))
+        for result in results:
+            if result is None:
+                continue
+            for name in SEGMENT_SIZES:
+                landmarks = get_segment(result, name)
+                if landmarks is not None and id(landmarks.values) not in kept:
+                    self.release(landmarks.values)
+
+    def __allocate(self, name:str) -> np.ndarray:
+        return np.empty((SEGMENT_SIZES[name], 4), dtype=self.__dtype)
@@ -0,0 +1,137 @@
+import numpy as np
+from .landmark_list import LandmarkList
+from .result_data import HolisticResults, SEGMENT_SIZES, get_segment, set_segment
+
+N_BLENDSHAPES = 52
+# Parts with a presence flag, in flag order.
+FRAME_PARTS = (*SEGMENT_SIZES, 'blendshapes')
+
+_N_ROWS = sum(SEGMENT_SIZES.values())
+_TIME_SIZE = 2  # one float64 stored in two float32 slots
+_LANDMARKS_OFFSET = _TIME_SIZE
+_BLENDSHAPES_OFFSET = _LANDMARKS_OFFSET + _N_ROWS * 4
+_PRESENCE_OFFSET = _BLENDSHAPES_OFFSET + N_BLENDSHAPES
+
+
+def _segment_rows() -> dict[str, slice]:
+    rows, offset = {}, 0
+    for name, size in SEGMENT_SIZES.items():
+        rows[name] = slice(offset, offset + size)
+        offset += size
+    return rows
+
+SEGMENT_ROWS = _segment_rows()
+
+
+class HolisticFrame:
+    """A whole frame in one fixed-layout float32 buffer, with named views for every part.
+
+    Copying, recording or writing a frame to shared memory is a single copy of `buffer`.
+
+    Layout (float32 elements):
+        time:        2 (the frame time [s] as one float64)
+        landmarks:   628 x 4 [x, y, z, confidence] rows of every segment of `SEGMENT_SIZES`, in order
+        blendshapes: 52
+        presence:    8 flags (1 if detected), one per part of `FRAME_PARTS`
+    """
+    SIZE = _PRESENCE_OFFSET + len(FRAME_PARTS)
+
+    def __init__(self, buffer: np.ndarray = None):
+        """
+        Args:
+            buffer (np.ndarray): Existing (SIZE,) float32 buffer to view, e.g. in shared memory. A new one by default.
+        """
+        if buffer is None:
+            buffer = np.zeros(HolisticFrame.SIZE, dtype=np.float32)
+        if buffer.shape != (HolisticFrame.SIZE,) or buffer.dtype != np.float32:
+            raise ValueError(f"expected a ({HolisticFrame.SIZE},) float32 buffer, got {buffer.shape} {buffer.dtype}")
+        self._buffer = buffer
+        self._time = buffer[0:_TIME_SIZE].view(np.float64)
+        self._landmarks = buffer[_LANDMARKS_OFFSET:_BLENDSHAPES_OFFSET].reshape(_N_ROWS, 4)
+        self._blendshapes = buffer[_BLENDSHAPES_OFFSET:_PRESENCE_OFFSET]
+        self._presence = buffer[_PRESENCE_OFFSET:]
+
+    @classmethod
+    def from_results(cls, results: HolisticResults, frame: "HolisticFrame" = None) -> "HolisticFrame":
+        """Pack `results` into `frame` (or a new frame). Parts that are missing are flagged absent."""
+        frame = frame if frame is not None else cls()
+        frame.time = results.time
+        for name, rows in SEGMENT_ROWS.items():
+            landmarks = get_segment(results, name)
+            present = landmarks is not None and len(landmarks.values) == rows.stop - rows.start
+            if present:
+                frame._landmarks[rows] = landmarks.values
+            frame.set_present(name, present)
+        blendshapes = results.face.blendshapes
+        present = blendshapes is not None and len(blendshapes) == N_BLENDSHAPES
+        if present:
+            frame._blendshapes[:] = blendshapes
+        frame.set_present('blendshapes', present)
+        return frame
+
+    def to_results(self) -> HolisticResults:
+        """Present parts as `HolisticResults`. The landmark lists are views of this frame, not copies."""
+        results = HolisticResults(None, None, None, self.time)
+        for name, rows in SEGMENT_ROWS.items():
+            if self.is_present(name):
+                set_segment(results, name, LandmarkList.from_array(self._landmarks[rows]))
+        if self.is_present('blendshapes'):
+            results.face.blendshapes = self._blendshapes
+        return results
+
+    def copy(self) -> "HolisticFrame":
+        return HolisticFrame(self._buffer.copy())
+
+    def copy_from(self, other: "HolisticFrame") -> None:
+        np.copyto(self._buffer, other.buffer)
+
+    def is_present(self, part: str) -> bool:
+        return bool(self._presence[FRAME_PARTS.index(part)])
+
+    def set_present(self, part: str, present: bool) -> None:
+        self._presence[FRAME_PARTS.index(part)] = present
+
+    def segment(self, name: str) -> np.ndarray:
+        """(N, 4) view of the landmarks of a segment of `SEGMENT_SIZES`."""
+        return self._landmarks[SEGMENT_ROWS[name]]
+
+    @property
+    def buffer(self) -> np.ndarray:
+        return self._buffer
+    @property
+    def time(self) -> float:
+        return float(self._time[0])
+    @time.setter
+    def time(self, time_s: float) -> None:
+        self._time[0] = time_s
+    @property
+    def landmarks(self) -> np.ndarray:
+        """(628, 4) view of the landmarks of every segment."""
+        return self._landmarks
+    @property
+    def pose_local(self) -> np.ndarray:
+        return self.segment('pose_local')
+    @property
+    def pose_world(self) -> np.ndarray:
+        return self.segment('pose_world')
+    @property
+    def left_hand_local(self) -> np.ndarray:
+        return self.segment('left_hand_local')
+    @property
+    def left_hand_world(self) -> np.ndarray:
+        return self.segment('left_hand_world')
+    @property
+    def right_hand_local(self) -> np.ndarray:
+        return self.segment('right_hand_local')
+    @property
+    def right_hand_world(self) -> np.ndarray:
+        return self.segment('right_hand_world')
+    @property
+    def face_landmarks(self) -> np.ndarray:
+        return self.segment('face_landmark')
+    @property
+    def blendshapes(self) -> np.ndarray:
+        return self._blendshapes
+    @property
+    def presence(self) -> np.ndarray:
+        return self._presence
@@ -2,8 +2,17 @@ import numpy as np
 from mediapipe_inferencer_core.util import float_util
 
 class Landmark:
+    __slots__ = ('__value',)
+
     def __init__(self, x=0, y=0, z=0, confidence=0):
         self.__value = np.array([x, y, z, confidence])
+
+    @classmethod
+    def view(cls, value: np.ndarray) -> "Landmark":
+        """Wrap a [x, y, z, confidence] row (e.g. of a `LandmarkList`) without copying it."""
+        landmark = cls.__new__(cls)
+        landmark.__value = value
+        return landmark
     @property
     def position(self):
         return self.__value[0:3]
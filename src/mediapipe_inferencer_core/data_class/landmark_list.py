@@ -2,12 +2,26 @@ import numpy as np
 from .landmark import Landmark
 
 class LandmarkList:
-    def __init__(self, listed_data: list[Landmark]):
-        self._value = np.array([[data.x, data.y, data.z, data.confidence] for data in listed_data])
+    __slots__ = ('_value',)
+
+    def __init__(self, listed_data: list[Landmark], dtype=None):
+        """
+        Args:
+            dtype: Storage type of the values, e.g. np.float32 to halve the memory. Inferred by default.
+        """
+        self._value = np.array([[data.x, data.y, data.z, data.confidence] for data in listed_data], dtype=dtype)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray, dtype=None) -> "LandmarkList":
+        """Wrap an (N, 4) array of [x, y, z, confidence] rows without copying it (unless `dtype` differs)."""
+        landmark_list = cls.__new__(cls)
+        landmark_list._value = np.asarray(values, dtype=dtype)
+        return landmark_list
 
     def value(self, index:int)->Landmark:
-        return Landmark(self._value[index, 0], self._value[index, 1],self._value[index, 2],self._value[index, 3])
+        """View of the `index`-th landmark. It shares memory with this list."""
+        return Landmark.view(self._value[index])
 
     @property
     def values(self) -> np.ndarray:
-        return self._value
\ No newline at end of file
+        return self._value
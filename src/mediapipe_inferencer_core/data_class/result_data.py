@@ -1,10 +1,29 @@
 from mediapipe_inferencer_core.data_class import LandmarkList
 from mediapipe_inferencer_core.packer import pack_to_landmark
+import numpy as np
+
+# Results are shared between snapshots instead of deep-copied, so packed arrays are made read-only:
+# a stage that changes a part (filtering, coordinate transform, ...) assigns a new array to its snapshot.
 
 class LandmarkResult:
     def __init__(self):
         self.__local = None
         self.__world = None
+
+    def update_pose(self, raw_pose, pool=None):
+        if len(raw_pose.pose_landmarks)>0:
+            pose_landmarks = raw_pose.pose_landmarks[0]
+            self.__local = _read_only(pack_to_landmark.pack_landmarks(
+                pose_landmarks, _buffer(pool, 'pose_local', len(pose_landmarks))))
+        if len(raw_pose.pose_world_landmarks)>0:
+            pose_world_landmarks = raw_pose.pose_world_landmarks[0]
+            self.__world = _read_only(pack_to_landmark.pack_landmarks(
+                pose_world_landmarks, _buffer(pool, 'pose_world', len(pose_world_landmarks))))
+
+    def snapshot(self) -> "LandmarkResult":
+        snapshot = LandmarkResult()
+        snapshot.__local, snapshot.__world = self.__local, self.__world
+        return snapshot
     @property
     def local(self) -> LandmarkList:
         return self.__local
@@ -24,12 +43,23 @@ class HandResult:
         self.__left_hand = LandmarkResult()
         self.__right_hand = LandmarkResult()
 
-    def update(self, raw_hand_results, raw_pose_results):
+    def update(self, raw_hand_results, raw_pose_results, pool=None):
         [left_hand_landmarks, right_hand_landmarks] = pack_to_landmark.extract_hand_landmarks(raw_hand_results, raw_pose_results)
         if left_hand_landmarks is not None and len(left_hand_landmarks)>0:
-            self.__left_hand.local, self.__left_hand.world = pack_to_landmark.pack_hand_landmarks(left_hand_landmarks)
+            self.__left_hand.local, self.__left_hand.world = map(_read_only, pack_to_landmark.pack_hand_landmarks(
+                left_hand_landmarks,
+                _buffer(pool, 'left_hand_local', len(left_hand_landmarks['local_landmark'])),
+                _buffer(pool, 'left_hand_world', len(left_hand_landmarks['world_landmark']))))
         if right_hand_landmarks is not None and len(right_hand_landmarks)>0:
-            self.__right_hand.local, self.__right_hand.world = pack_to_landmark.pack_hand_landmarks(right_hand_landmarks)
+            self.__right_hand.local, self.__right_hand.world = map(_read_only, pack_to_landmark.pack_hand_landmarks(
+                right_hand_landmarks,
+                _buffer(pool, 'right_hand_local', len(right_hand_landmarks['local_landmark'])),
+                _buffer(pool, 'right_hand_world', len(right_hand_landmarks['world_landmark']))))
+
+    def snapshot(self) -> "HandResult":
+        snapshot = HandResult()
+        snapshot.__left_hand, snapshot.__right_hand = self.__left_hand.snapshot(), self.__right_hand.snapshot()
+        return snapshot
 
     @property
     def left(self) -> LandmarkResult:
@@ -44,13 +74,20 @@ class FaceResult:
         self.__landmarks = None
         self.__blendshapes = None
 
-    def update(self, raw_results):
+    def update(self, raw_results, pool=None):
         face_results = raw_results
         if face_results is not None:
             if len(face_results.face_landmarks)>0:
-                self.__landmarks = pack_to_landmark.pack_landmarks(face_results.face_landmarks[0])
+                face_landmarks = face_results.face_landmarks[0]
+                self.__landmarks = _read_only(pack_to_landmark.pack_landmarks(
+                    face_landmarks, _buffer(pool, 'face_landmark', len(face_landmarks))))
             if len(face_results.face_blendshapes)>0:
-                self.__blendshapes = pack_to_landmark.pack_blendshapes(face_results.face_blendshapes[0])
+                self.__blendshapes = _read_only(pack_to_landmark.pack_blendshapes(face_results.face_blendshapes[0]))
+
+    def snapshot(self) -> "FaceResult":
+        snapshot = FaceResult()
+        snapshot.__landmarks, snapshot.__blendshapes = self.__landmarks, self.__blendshapes
+        return snapshot
 
     @property
     def landmarks(self)->LandmarkList:
@@ -61,26 +98,52 @@ class FaceResult:
     @property
     def blendshapes(self)->list[float]:
         return self.__blendshapes
+    @blendshapes.setter
+    def blendshapes(self, result)->None:
+        self.__blendshapes = result
 
 
 class HolisticResults:
-    def __init__(self, raw_pose, raw_hand, raw_face, time_s):
+    def __init__(self, raw_pose, raw_hand, raw_face, time_s, pool=None):
+        """
+        Args:
+            pool (LandmarkBufferPool): Pool to pack the landmarks into. New arrays are allocated by default.
+        """
         self.__pose_result = LandmarkResult()
         self.__hand_result = HandResult()
         self.__face_results = FaceResult()
         self.__time_s = time_s
-        self.update(raw_pose, raw_hand, raw_face)
+        self.__part_times = {}
+        self.update(raw_pose, raw_hand, raw_face, pool)
 
-    def update(self, raw_pose, raw_hand, raw_face):
+    def update(self, raw_pose, raw_hand, raw_face, pool=None):
         if raw_pose is not None:
-            if len(raw_pose.pose_landmarks)>0:
-                self.__pose_result.local = pack_to_landmark.pack_landmarks(raw_pose.pose_landmarks[0])
-            if len(raw_pose.pose_world_landmarks)>0:
-                self.__pose_result.world = pack_to_landmark.pack_landmarks(raw_pose.pose_world_landmarks[0])
+            self.__pose_result.update_pose(raw_pose, pool)
         if raw_hand is not None:
-            self.__hand_result.update(raw_hand, raw_pose)
+            self.__hand_result.update(raw_hand, raw_pose, pool)
         if raw_face is not None:
-            self.__face_results.update(raw_face)
+            self.__face_results.update(raw_face, pool)
+
+    @classmethod
+    def from_parts(cls, pose:"LandmarkResult"=None, hand:"HandResult"=None, face:"FaceResult"=None, time_s:float=0.0,
+                   part_times:dict[str, float]=None) -> "HolisticResults":
+        """Results made of snapshots of already packed parts. Missing parts are empty."""
+        results = cls(None, None, None, time_s)
+        results.__part_times = dict(part_times or {})
+        if pose is not None:
+            results.__pose_result = pose.snapshot()
+        if hand is not None:
+            results.__hand_result = hand.snapshot()
+        if face is not None:
+            results.__face_results = face.snapshot()
+        return results
+
+    def snapshot(self) -> "HolisticResults":
+        """Cheap copy of the result tree that shares the landmark arrays.
+
+        Assigning a part of the snapshot (e.g. `snapshot.pose.world = ...`) leaves this object untouched.
+        """
+        return HolisticResults.from_parts(self.__pose_result, self.__hand_result, self.__face_results, self.__time_s, self.__part_times)
 
     @property
     def pose(self)->LandmarkResult:
@@ -93,4 +156,56 @@ class HolisticResults:
         return self.__face_results
     @property
     def time(self)->float:
-        return self.__time_s
\ No newline at end of file
+        return self.__time_s
+    @property
+    def part_times(self)->dict[str, float]:
+        """Capture time [s] of the frame each part ('pose', 'hand', 'face') was detected in, when known.
+        A part reused from an earlier frame is older than `time`."""
+        return self.__part_times
+
+
+# Landmark count of every stream, in the order they are laid out in a HolisticFrame or a FilterBank.
+SEGMENT_SIZES = {
+    'pose_local':       33,
+    'pose_world':       33,
+    'left_hand_local':  21,
+    'left_hand_world':  21,
+    'right_hand_local': 21,
+    'right_hand_world': 21,
+    'face_landmark':    478,
+}
+
+def get_segment(results:HolisticResults, name:str) -> LandmarkList:
+    match name:
+        case 'pose_local':       return results.pose.local
+        case 'pose_world':       return results.pose.world
+        case 'left_hand_local':  return results.hand.left.local
+        case 'left_hand_world':  return results.hand.left.world
+        case 'right_hand_local': return results.hand.right.local
+        case 'right_hand_world': return results.hand.right.world
+        case 'face_landmark':    return results.face.landmarks
+    raise KeyError(name)
+
+def set_segment(results:HolisticResults, name:str, landmarks:LandmarkList) -> None:
+    match name:
+        case 'pose_local':       results.pose.local = landmarks
+        case 'pose_world':       results.pose.world = landmarks
+        case 'left_hand_local':  results.hand.left.local = landmarks
+        case 'left_hand_world':  results.hand.left.world = landmarks
+        case 'right_hand_local': results.hand.right.local = landmarks
+        case 'right_hand_world': results.hand.right.world = landmarks
+        case 'face_landmark':    results.face.landmarks = landmarks
+        case _: raise KeyError(name)
+
+def _read_only(result):
+    """Mark the array of a `LandmarkList` (or a plain array) read-only and return it."""
+    values = result.values if isinstance(result, LandmarkList) else result
+    if isinstance(values, np.ndarray):
+        values.flags.writeable = False
+    return result
+
+def _buffer(pool, name:str, count:int):
+    """Array of `pool` for the `count` landmarks of segment `name`, or None to allocate a new one."""
+    if pool is None or SEGMENT_SIZES[name] != count:
+        return None
+    return pool.acquire(name)
@@ -1,2 +1,4 @@
 from .detector_handler import *
-from .landmark_detector import *
\ No newline at end of file
+from .landmark_detector import *
+from .process_detector import ProcessDetector
+from .roi_detector import RoiDetector, HAND_POSE_LANDMARKS, FACE_POSE_LANDMARKS
@@ -1,35 +1,360 @@
 import mediapipe as mp
+import threading
 import time
-from mediapipe_inferencer_core.data_class.result_data import HolisticResults
+from typing import Callable
+from mediapipe_inferencer_core.data_class.result_data import HolisticResults, LandmarkResult, HandResult, FaceResult
+from mediapipe_inferencer_core.data_class.buffer_pool import LandmarkBufferPool
 from mediapipe_inferencer_core.detector.landmark_detector import LandmarkDetector
+from mediapipe_inferencer_core.motion_gate import MotionGate, landmark_region
+from mediapipe_inferencer_core.input_resizer import InputResizer
+from mediapipe_inferencer_core.packer.pack_to_landmark import pack_raw_results
+from mediapipe_inferencer_core.packer.remap_landmarks import remap_results
 
 
 class DetectorHandler:
-    def __init__(self, pose: LandmarkDetector = None, hand: LandmarkDetector = None, face: LandmarkDetector = None):
+    """Run the pose, hand and face detectors on the same frames and aggregate their results per frame.
+
+    Frames are stamped with a monotonic capture clock. `results` pairs the results the detectors
+    returned for the same frame: the newest frame every detector answered, or a newer one that some
+    detector has not answered within `wait_budget` (e.g. because MediaPipe dropped it), whose missing
+    parts are taken from the latest earlier result of that detector.
+
+    Frames are published as soon as the detector callbacks complete them: consumers block in
+    `wait_for_results` or `subscribe` to them instead of polling `results`.
+
+    A frame is only submitted to the detectors that have fewer than `max_in_flight` frames in flight,
+    since MediaPipe drops the frames a busy detector cannot take. A frame that was not submitted to a
+    detector does not wait for its result.
+
+    With `partial_updates`, every detector result is published as soon as it arrives, together with
+    the latest result of the other detectors, so fast detectors do not wait for slow ones.
+
+    `rates` and `frame_intervals` run a detector on fewer frames than the others, to bound the time spent
+    in each model. Frame intervals count the frames passed to `inference` since the last frame submitted to
+    the detector, so a detector that is busy when due takes the next frame it can. The frames a detector
+    does not run on reuse its latest result, whose capture time is kept in `HolisticResults.part_times`. A `motion_gate` likewise skips the detectors whose region of the
+    frame has not changed since they last ran.
+
+    With a `resizer`, every detector shares one frame resized to the inference resolution. Landmarks
+    are mapped back to normalized coordinates of the captured frame.
+    """
+    def __init__(self, pose: LandmarkDetector = None, hand: LandmarkDetector = None, face: LandmarkDetector = None,
+                 pool: LandmarkBufferPool = None, wait_budget: float = 0.03, clock: Callable[[], float] = time.monotonic,
+                 max_in_flight: int = 1, request_timeout: float = 0.5, partial_updates: bool = False,
+                 rates: dict[str, float] = None, frame_intervals: dict[str, int] = None, motion_gate: MotionGate = None,
+                 resizer: InputResizer = None):
+        """
+        Args:
+            pool (LandmarkBufferPool): Pool to pack the landmarks into. New arrays are allocated by default.
+            wait_budget (float): Time [s] after capture to wait for the results of every detector.
+            clock (Callable): Monotonic clock [s] the frames are stamped with.
+            max_in_flight (int): Frames a detector may be processing at once.
+            request_timeout (float): Time [s] after which a frame without result counts as dropped.
+            partial_updates (bool): Publish every detector result on arrival instead of pairing results by frame.
+            rates (dict[str, float]): Maximum rate [Hz] per part ('pose', 'hand' or 'face'). Unlimited by default.
+            frame_intervals (dict[str, int]): Run the detector of a part on one frame out of this many. Every frame by default.
+            motion_gate (MotionGate): Skip the detectors of static parts. Every due detector runs by default.
+            resizer (InputResizer): Resize the frames before inference. The captured frames are used by default.
+        """
         self.__pose = pose
         self.__hand = hand
         self.__face = face
         self.__detectors = [self.__pose, self.__hand, self.__face]
+        self.__pool = pool
+        self.__wait_budget_ms = wait_budget * 1000
+        self.__clock = clock
+        self.__max_in_flight = max_in_flight
+        self.__request_timeout_ms = request_timeout * 1000
+        self.__partial_updates = partial_updates
+        self.__periods_ms = {part: 1000 / rate for part, rate in (rates or {}).items()}
+        self.__frame_intervals = frame_intervals or {}
+        # Index of the frame passed to `inference`, and of the last frame submitted to each detector.
+        self.__frame_index = 0
+        self.__submitted_index = {'pose': None, 'hand': None, 'face': None}
+        self.__next_due_ms = {'pose': 0.0, 'hand': 0.0, 'face': 0.0}
+        self.__skipped = {'pose': 0, 'hand': 0, 'face': 0}
+        self.__throttled = {'pose': 0, 'hand': 0, 'face': 0}
+        self.__motion_gate = motion_gate
+        self.__static = {'pose': 0, 'hand': 0, 'face': 0}
+        self.__resizer = resizer
+        # (first frame timestamp [ms], region of the frame the resized frames cover, frame size) on every change.
+        self.__input_regions = []
         self.latest_time_ms = 0
+        # Packed part per detector and the frame timestamps it was packed from.
+        self.__parts = {'pose': LandmarkResult(), 'hand': HandResult(), 'face': FaceResult()}
+        self.__packed_timestamps = {'pose': None, 'hand': None, 'face': None}
+        self.__delivered_timestamps = {}
+        self.__frame_time_ms = 0
+        # Published frame (front buffer), swapped under the lock for the next one once it is packed.
+        self.__condition = threading.Condition()
+        self.__published = None
+        self.__published_sequence = 0
+        self.__taken_sequence = 0
+        self.__subscribers = []
+        self.__part_subscribers = []
+        # Replaced parts, released once no consumer can be reading them anymore.
+        self.__retired = []
+        for detector in self.__detectors:
+            if detector is not None:
+                detector.add_listener(self.__on_result)
 
     def inference(self, image):
-        t_ms = int(time.time() * 1000)
+        t_ms = int(self.__clock() * 1000)
         if t_ms <= self.latest_time_ms:
             return
-        mp_image = mp.Image(image_format = mp.ImageFormat.SRGB, data = image)
+        due = self.__due_detectors(t_ms, self.__frame_index)
+        static = set()
+        if self.__motion_gate is not None and due:
+            frame = self.__motion_gate.downscale(image)
+            regions = self.__motion_regions()
+            static = {part for part in due if self.__motion_gate.is_static(part, frame, regions.get(part))}
+            due = {part: detector for part, detector in due.items() if part not in static}
+        ready = self.__ready_detectors(t_ms, due)
+        for part in self.__named_detectors():
+            if part in static:
+                self.__static[part] += 1
+            elif part not in due:
+                self.__throttled[part] += 1
+            elif part not in ready:
+                self.__skipped[part] += 1
+        for part in ready:
+            self.__submitted_index[part] = self.__frame_index
+            if part in self.__periods_ms:
+                self.__next_due_ms[part] = t_ms + self.__periods_ms[part]
+            if self.__motion_gate is not None:
+                self.__motion_gate.mark_submitted(part, frame)
+        self.__frame_index += 1
+        if not ready:
+            return
+        if self.__resizer is not None:
+            frame_size = (image.shape[1], image.shape[0])
+            image, region = self.__resizer.resize(image)
+            with self.__condition:
+                if not self.__input_regions or self.__input_regions[-1][1:] != (region, frame_size):
+                    self.__input_regions.append((t_ms, region, frame_size))
+        mp_image = None
+        for detector in ready.values():
+            if not detector.takes_mp_image:
+                detector.submit(image, t_ms)
+                continue
+            if mp_image is None:
+                mp_image = mp.Image(image_format = mp.ImageFormat.SRGB, data = image)
+            detector.submit(mp_image, t_ms)
+        self.latest_time_ms = t_ms
+
+    def close(self):
         for detector in self.__detectors:
             if detector is not None:
-                detector.inference(mp_image, t_ms)
-        self.latest_time_ms = t_ms
+                detector.close()
+
+    @property
+    def accepts_frame(self) -> bool:
+        """Whether any detector can take a new frame, so it is worth preparing one for `inference`.
+
+        Frame intervals are not checked: the frames a detector skips must be passed to `inference` to be counted.
+        """
+        now_ms = int(self.__clock() * 1000)
+        return bool(self.__ready_detectors(now_ms, self.__due_detectors(now_ms)))
+
+    @property
+    def statistics(self) -> dict[str, dict[str, int]]:
+        """Frames submitted, completed, dropped (by MediaPipe), skipped (detector busy), throttled
+        (not due at the detector rate or frame interval) and static (no motion in the part), per part."""
+        return {part: {**detector.counts, 'skipped': self.__skipped[part], 'throttled': self.__throttled[part],
+                       'static': self.__static[part]}
+                for part, detector in self.__named_detectors().items()}
+
+    @property
+    def fresh_parts(self) -> set[str]:
+        """Parts with a detector result that has not been published in a frame yet."""
+        with self.__condition:
+            _, selected = self.__select_frame()
+            return {part for part, (timestamp_ms, _) in selected.items() if self.__delivered_timestamps.get(part) != timestamp_ms}
 
     @property
     def results(self):
-        pose_result = self.__pose.results if self.__pose is not None else None
-        hand_result = self.__hand.results if self.__hand is not None else None
-        face_result = self.__face.results if self.__face is not None else None
-        return HolisticResults(
-            pose_result,
-            hand_result,
-            face_result,
-            self.latest_time_ms / 1000
-        )
\ No newline at end of file
+        """Results of the latest aggregated frame, timed at its capture [s]."""
+        with self.__condition:
+            self.__publish()
+            if self.__published is None:
+                return HolisticResults.from_parts(time_s=self.__frame_time_ms / 1000)
+            return self.__take()
+
+    def wait_for_results(self, timeout: float = None) -> HolisticResults | None:
+        """Block until a frame newer than the last one taken is published and return it.
+
+        Args:
+            timeout (float): Maximum time [s] to wait. None waits forever.
+
+        Returns:
+            HolisticResults | None: The latest published frame, or None on timeout.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self.__condition:
+            while self.__published_sequence == self.__taken_sequence:
+                # Frames incomplete within the wait budget are published on expiry, not on a callback.
+                self.__publish()
+                if self.__published_sequence != self.__taken_sequence:
+                    break
+                wait = self.__wait_budget_ms / 1000
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    wait = min(wait, remaining)
+                self.__condition.wait(wait)
+            return self.__take()
+
+    def subscribe(self, callback: Callable[[HolisticResults], None], partial: bool = False) -> None:
+        """Call `callback(results)` with every published frame, from the detector callback thread.
+
+        The results (and their landmark arrays) are only valid until `callback` returns. Callbacks run under
+        the lock of the handler, so they must be quick and must not raise: they hold up the other detector
+        callbacks and `wait_for_results`, and an exception propagates into the MediaPipe callback.
+
+        Args:
+            partial (bool): Instead of the whole frame, pass one results per part updated by the frame,
+                holding only that part and timed at the capture of the detector result it comes from.
+        """
+        with self.__condition:
+            (self.__part_subscribers if partial else self.__subscribers).append(callback)
+
+    def __on_result(self, timestamp_ms: int) -> None:
+        with self.__condition:
+            self.__publish()
+
+    def __publish(self) -> None:
+        """Pack and publish the next aggregated frame, if a detector result completed one. Call with the lock held."""
+        frame_time_ms, selected = self.__select_frame()
+        if frame_time_ms is None or frame_time_ms < self.__frame_time_ms:
+            return
+        updated = {part: timestamp_ms for part, (timestamp_ms, _) in selected.items()
+                   if self.__delivered_timestamps.get(part) != timestamp_ms}
+        if not updated:
+            return
+        self.__frame_time_ms = frame_time_ms
+        pose_time_ms, raw_pose = selected.get('pose', (None, None))
+        hand_time_ms, raw_hand = selected.get('hand', (None, None))
+        face_time_ms, raw_face = selected.get('face', (None, None))
+        repack_pose = self.__packed_timestamps['pose'] != pose_time_ms
+        # Hands are assigned to the left and right wrist of the pose, so they are repacked on a new pose too.
+        repack_hand = self.__packed_timestamps['hand'] != (hand_time_ms, pose_time_ms)
+        if repack_pose or repack_hand:
+            raw_pose = self.__to_frame(raw_pose, pose_time_ms)
+        if repack_pose:
+            pose = LandmarkResult()
+            if raw_pose is not None:
+                pose.update_pose(raw_pose, self.__pool)
+            self.__replace('pose', pose, pose_time_ms)
+        if repack_hand:
+            hand = HandResult()
+            if raw_hand is not None:
+                hand.update(self.__to_frame(raw_hand, hand_time_ms), raw_pose, self.__pool)
+            self.__replace('hand', hand, (hand_time_ms, pose_time_ms))
+        if self.__packed_timestamps['face'] != face_time_ms:
+            face = FaceResult()
+            if raw_face is not None:
+                face.update(self.__to_frame(raw_face, face_time_ms), self.__pool)
+            self.__replace('face', face, face_time_ms)
+        self.__delivered_timestamps = {part: timestamp_ms for part, (timestamp_ms, _) in selected.items()}
+        part_times = {part: timestamp_ms / 1000 for part, (timestamp_ms, _) in selected.items()}
+        self.__published = HolisticResults.from_parts(**self.__parts, time_s=self.__frame_time_ms / 1000, part_times=part_times)
+        self.__published_sequence += 1
+        for callback in self.__subscribers:
+            callback(self.__published)
+        for part, timestamp_ms in updated.items():
+            part_results = HolisticResults.from_parts(**{part: self.__parts[part]}, time_s=timestamp_ms / 1000,
+                                                      part_times={part: timestamp_ms / 1000})
+            for callback in self.__part_subscribers:
+                callback(part_results)
+        if self.__taken_sequence == 0:
+            # Nobody takes frames, so nothing outlives the subscribers.
+            self.__release_retired()
+        self.__condition.notify_all()
+
+    def __take(self) -> HolisticResults:
+        # The consumer is done with the frame it took before, so the parts replaced since can be recycled.
+        self.__release_retired()
+        self.__taken_sequence = self.__published_sequence
+        return self.__published
+
+    def __release_retired(self) -> None:
+        if self.__pool is not None:
+            self.__pool.release_results(*self.__retired)
+        self.__retired.clear()
+
+    def __named_detectors(self) -> dict[str, LandmarkDetector]:
+        return {part: detector for part, detector in zip(('pose', 'hand', 'face'), self.__detectors) if detector is not None}
+
+    def __motion_regions(self) -> dict[str, tuple[float, float, float, float]]:
+        """Regions of the latest hands and face, which the motion gate compares for their detectors."""
+        with self.__condition:
+            hand, face = self.__parts['hand'], self.__parts['face']
+            hands = [side.local.values for side in (hand.left, hand.right) if side.local is not None]
+            return {'hand': landmark_region(*hands),
+                    'face': landmark_region(face.landmarks.values) if face.landmarks is not None else None}
+
+    def __due_detectors(self, now_ms: int, frame_index: int = None) -> dict[str, LandmarkDetector]:
+        """Detectors whose rate, and frame interval at `frame_index` unless None, let them run on the next frame."""
+        due = {}
+        for part, detector in self.__named_detectors().items():
+            submitted_index = self.__submitted_index[part]
+            if (frame_index is not None and submitted_index is not None
+                    and frame_index - submitted_index < self.__frame_intervals.get(part, 1)):
+                continue
+            period_ms = self.__periods_ms.get(part)
+            # A frame up to a quarter period early is taken, so frame jitter does not skip a whole frame.
+            if period_ms is not None and now_ms < self.__next_due_ms[part] - period_ms / 4:
+                continue
+            due[part] = detector
+        return due
+
+    def __ready_detectors(self, now_ms: int, due: dict[str, LandmarkDetector]) -> dict[str, LandmarkDetector]:
+        ready = {}
+        for part, detector in self.__named_detectors().items():
+            detector.expire(now_ms - self.__request_timeout_ms)
+            if part in due and len(detector.pending) < self.__max_in_flight:
+                ready[part] = detector
+        return ready
+
+    def __select_frame(self) -> tuple[int, dict[str, tuple[int, object]]]:
+        """Timestamp [ms] of the frame to deliver and the (timestamp, raw result) used for each part."""
+        detectors = self.__named_detectors()
+        # Pending frames are read first: a frame leaves `pending` only once it is in `history`.
+        pending = [set(detector.pending) for detector in detectors.values()]
+        histories = {part: detector.history for part, detector in detectors.items()}
+        answered = [{timestamp_ms for timestamp_ms, _ in history} for history in histories.values()]
+        if self.__partial_updates:
+            latest = {part: history[-1] for part, history in histories.items() if history}
+            return max((timestamp_ms for timestamp_ms, _ in latest.values()), default=None), latest
+        now_ms = self.__clock() * 1000
+        for frame_time_ms in sorted(set().union(*answered), reverse=True):
+            # Detectors the frame was not submitted to (or that dropped it) are not waited for.
+            complete = all(frame_time_ms in timestamps or frame_time_ms not in in_flight
+                           for timestamps, in_flight in zip(answered, pending))
+            if complete or now_ms - frame_time_ms >= self.__wait_budget_ms:
+                break
+        else:
+            return None, {}
+        selected = {}
+        for part, history in histories.items():
+            earlier = [entry for entry in history if entry[0] <= frame_time_ms]
+            if earlier:
+                selected[part] = earlier[-1]
+        return frame_time_ms, selected
+
+    def __to_frame(self, raw_results, timestamp_ms: int):
+        """`raw_results` in normalized coordinates of the captured frame, if the frame was letterboxed. Call with the lock held."""
+        if raw_results is None:
+            return None
+        entry = next((entry for entry in reversed(self.__input_regions) if entry[0] <= timestamp_ms), None)
+        if entry is None or entry[1] is None:
+            return raw_results
+        _, region, frame_size = entry
+        return remap_results(pack_raw_results(raw_results), region, frame_size)
+
+    def __replace(self, part: str, packed, timestamp) -> None:
+        # The handler owns the buffers of its packed parts, so a replaced part goes back to the pool.
+        self.__retired.append(HolisticResults.from_parts(**{part: self.__parts[part]}))
+        self.__parts[part] = packed
+        self.__packed_timestamps[part] = timestamp
@@ -1,33 +1,98 @@
 import mediapipe as mp
 from mediapipe.tasks import python as mp_tasks
-from abc import ABC, abstractproperty, abstractclassmethod
+from abc import ABC, abstractclassmethod
+from collections import deque
+import threading
+from typing import Callable
 
 class LandmarkDetector(ABC):
+    # Results kept per detector, so results of the same input frame can be paired across detectors.
+    HISTORY_LENGTH = 8
+    # Whether `inference` takes an `mp.Image` (or the RGB numpy image it is made from).
+    takes_mp_image = True
+
+    def __init__(self):
+        self._history = deque(maxlen=LandmarkDetector.HISTORY_LENGTH)
+        self._listeners = []
+        # Timestamps of the submitted frames without a result yet, oldest first.
+        self._pending = deque()
+        self._counts = {'submitted': 0, 'completed': 0, 'dropped': 0}
+        self._lock = threading.Lock()
+
     @abstractclassmethod
     def inference(self, image, frame_timestamp_ms):
         pass
-    @abstractproperty
+
+    @property
+    def pending(self) -> list[int]:
+        """Timestamps [ms] of the frames submitted with `submit` that are still in flight."""
+        with self._lock:
+            return list(self._pending)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of frames submitted, completed (result received) and dropped (no result) so far."""
+        with self._lock:
+            return dict(self._counts)
+
+    def submit(self, image, frame_timestamp_ms: int) -> None:
+        """Run `inference` and track the frame until its result arrives."""
+        with self._lock:
+            self._pending.append(frame_timestamp_ms)
+            self._counts['submitted'] += 1
+        self.inference(image, frame_timestamp_ms)
+
+    def expire(self, before_ms: int) -> None:
+        """Count the frames submitted before `before_ms` that are still in flight as dropped."""
+        with self._lock:
+            self.__drop_pending(before_ms)
+
+    @property
     def results(self):
+        """Latest raw result, or None before the first one."""
+        return self._history[-1][1] if self._history else None
+
+    @property
+    def history(self) -> list[tuple[int, object]]:
+        """(frame_timestamp_ms, raw result) of the latest results, oldest first."""
+        return list(self._history)
+
+    def close(self) -> None:
+        """Free the resources of the detector."""
         pass
 
+    def add_listener(self, listener: Callable[[int], None]) -> None:
+        """Call `listener(frame_timestamp_ms)` from the MediaPipe callback thread whenever a result arrives."""
+        self._listeners.append(listener)
+
+    def _save_results(self, results, output_image, timestamp_ms: int):
+        with self._lock:
+            # Stored before the frame leaves `pending`, so a frame is always either pending or in `history`.
+            self._history.append((timestamp_ms, results))
+            # Results arrive in submission order, so MediaPipe dropped the frames submitted before this one.
+            self.__drop_pending(timestamp_ms)
+            if self._pending and self._pending[0] == timestamp_ms:
+                self._pending.popleft()
+                self._counts['completed'] += 1
+        for listener in self._listeners:
+            listener(timestamp_ms)
+
+    def __drop_pending(self, before_ms: int) -> None:
+        while self._pending and self._pending[0] < before_ms:
+            self._pending.popleft()
+            self._counts['dropped'] += 1
+
 class PoseDetector(LandmarkDetector):
     def __init__(self, model_path, min_confidence):
+        super().__init__()
         options = mp_tasks.vision.PoseLandmarkerOptions(
             base_options = mp_tasks.BaseOptions(model_asset_buffer = open(model_path, "rb").read(), delegate = "GPU"),
             min_pose_detection_confidence = min_confidence,
             min_tracking_confidence = min_confidence,
             running_mode = mp_tasks.vision.RunningMode.LIVE_STREAM,
-            result_callback = self.__save_results
+            result_callback = self._save_results
             )
         self.landmarker = mp_tasks.vision.PoseLandmarker.create_from_options(options)
-        self.__results = None
-
-    @property
-    def results(self):
-        return self.__results
-
-    def __save_results(self, results, output_image, timesamp_ms: int):
-        self.__results = results
 
     def inference(self, image, frame_timestamp_ms):
         self.landmarker.detect_async(image, frame_timestamp_ms)
@@ -35,23 +100,16 @@ class PoseDetector(LandmarkDetector):
 
 class HandDetector(LandmarkDetector):
     def __init__(self, model_path, min_confidence):
+        super().__init__()
         options = mp_tasks.vision.HandLandmarkerOptions(
             base_options = mp_tasks.BaseOptions(model_asset_buffer = open(model_path, "rb").read(), delegate = "GPU"),
             min_hand_detection_confidence = min_confidence,
             min_tracking_confidence = min_confidence,
             num_hands = 2,
             running_mode = mp_tasks.vision.RunningMode.LIVE_STREAM,
-            result_callback=self.__save_results)
+            result_callback=self._save_results)
 
         self.landmarker = mp_tasks.vision.HandLandmarker.create_from_options(options)
-        self.__results = None
-
-    @property
-    def results(self):
-        return self.__results
-
-    def __save_results(self, results, output_image, timesamp_ms: int):
-        self.__results = results
 
     def inference(self, image, frame_timestamp_ms):
         self.landmarker.detect_async(image, frame_timestamp_ms)
@@ -59,6 +117,7 @@ class HandDetector(LandmarkDetector):
 
 class FaceDetector(LandmarkDetector):
     def __init__(self, model_path, min_confidence):
+        super().__init__()
         options = mp_tasks.vision.FaceLandmarkerOptions(
             base_options = mp_tasks.BaseOptions(model_asset_buffer = open(model_path, "rb").read(), delegate = "GPU"),
             min_face_detection_confidence = min_confidence,
@@ -67,17 +126,9 @@ class FaceDetector(LandmarkDetector):
             output_facial_transformation_matrixes = True,
             num_faces = 1,
             running_mode = mp_tasks.vision.RunningMode.LIVE_STREAM,
-            result_callback=self.__save_results)
+            result_callback=self._save_results)
 
         self.landmarker = mp_tasks.vision.FaceLandmarker.create_from_options(options)
-        self.__results = None
-
-    @property
-    def results(self):
-        return self.__results
-
-    def __save_results(self, results, output_image, timesamp_ms: int):
-        self.__results = results
 
     def inference(self, image, frame_timestamp_ms):
         self.landmarker.detect_async(image, frame_timestamp_ms)
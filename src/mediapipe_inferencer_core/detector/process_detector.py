@@ -0,0 +1,113 @@
+import multiprocessing
+import os
+import queue
+import threading
+import mediapipe as mp
+from mediapipe_inferencer_core.detector.landmark_detector import LandmarkDetector
+from mediapipe_inferencer_core.packer.pack_to_landmark import pack_raw_results
+from mediapipe_inferencer_core.shared_frame_ring import SharedFrameRing
+
+
+class ProcessDetector(LandmarkDetector):
+    """Run a `LandmarkDetector` in its own worker process, so the models scale across cores.
+
+    Frames go to the worker through a `SharedFrameRing`: only the slot and the timestamp are sent over
+    a queue, and the slot is reused once the worker reports it has read it. The worker sends its results
+    back with every landmark list packed into an (N, 4) array, which the packers accept in place of
+    MediaPipe landmark lists.
+    """
+    takes_mp_image = False
+
+    def __init__(self, detector_class: type, *args, slots: int = 4, cpu_affinity: list[int] = None):
+        """
+        Args:
+            detector_class (type): `LandmarkDetector` created in the worker with `args`, e.g. `PoseDetector`.
+            slots (int): Frames in the ring. Must exceed the frames in flight (`DetectorHandler` max_in_flight).
+            cpu_affinity (list[int]): CPUs to pin the worker to (Linux only). Any CPU by default.
+        """
+        super().__init__()
+        context = multiprocessing.get_context('spawn')
+        self.__requests = context.Queue()
+        self.__results = context.Queue()
+        self.__process = context.Process(
+            target=_run_worker, args=(detector_class, args, cpu_affinity, self.__requests, self.__results), daemon=True)
+        self.__process.start()
+        self.__wait_for_start()
+        self.__slots = slots
+        # One ring per frame shape, since the worker may still read frames of a previous shape.
+        self.__rings: dict[tuple, SharedFrameRing] = {}
+        # (ring name, slot) of the frames sent to the worker that it has not read yet.
+        self.__busy_slots: set[tuple[str, int]] = set()
+        self.__busy_lock = threading.Lock()
+        self.__receiver = threading.Thread(target=self.__receive, daemon=True)
+        self.__receiver.start()
+
+    def inference(self, image, frame_timestamp_ms):
+        ring = self.__rings.get(image.shape)
+        if ring is None:
+            ring = self.__rings[image.shape] = SharedFrameRing(image.shape, self.__slots)
+        # A frame that expired from `pending` may still be queued, so a slot is only free once the worker read it.
+        with self.__busy_lock:
+            slot = next((slot for slot in range(self.__slots) if (ring.name, slot) not in self.__busy_slots), None)
+            if slot is None:
+                # Every slot is in flight: the frame stays pending until it expires as dropped.
+                return
+            self.__busy_slots.add((ring.name, slot))
+        ring.write(slot, image)
+        self.__requests.put((ring.name, ring.shape, self.__slots, slot, frame_timestamp_ms))
+
+    def close(self) -> None:
+        self.__requests.put(None)
+        self.__process.join(timeout=5)
+        if self.__process.is_alive():
+            self.__process.terminate()
+        self.__results.put(None)
+        self.__receiver.join(timeout=5)
+        for ring in self.__rings.values():
+            ring.close()
+
+    def __wait_for_start(self) -> None:
+        """Block until the worker created its detector, and raise the error it failed with if it did not."""
+        while True:
+            try:
+                message = self.__results.get(timeout=1)
+                break
+            except queue.Empty:
+                if not self.__process.is_alive():
+                    raise RuntimeError(f"Detector worker exited with code {self.__process.exitcode} during start-up")
+        if message[0] == 'error':
+            self.__process.join()
+            raise message[1]
+
+    def __receive(self) -> None:
+        while (message := self.__results.get()) is not None:
+            if message[0] == 'read':
+                with self.__busy_lock:
+                    self.__busy_slots.discard(message[1:])
+            else:
+                _, timestamp_ms, results = message
+                self._save_results(results, None, timestamp_ms)
+
+
+def _run_worker(detector_class: type, args: tuple, cpu_affinity: list[int], requests, results) -> None:
+    if cpu_affinity is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpu_affinity)
+    try:
+        detector = detector_class(*args)
+    except Exception as error:
+        results.put(('error', error))
+        return
+    detector.add_listener(lambda timestamp_ms: results.put(('results', timestamp_ms, pack_raw_results(detector.results))))
+    results.put(('started',))
+    rings = {}
+    while (request := requests.get()) is not None:
+        name, shape, slots, slot, timestamp_ms = request
+        if name not in rings:
+            rings[name] = SharedFrameRing(shape, slots, name)
+        # mp.Image copies the frame, so the slot is not read after this.
+        image = mp.Image(image_format = mp.ImageFormat.SRGB, data = rings[name].frame(slot))
+        results.put(('read', name, slot))
+        detector.inference(image, timestamp_ms)
+    detector.close()
+    for ring in rings.values():
+        ring.close()
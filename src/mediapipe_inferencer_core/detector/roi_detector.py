@@ -0,0 +1,117 @@
+import threading
+import cv2
+import mediapipe as mp
+import numpy as np
+from mediapipe_inferencer_core.detector.landmark_detector import LandmarkDetector
+from mediapipe_inferencer_core.packer.pack_to_landmark import landmarks_to_array, pack_raw_results
+from mediapipe_inferencer_core.packer.remap_landmarks import remap_tiled_results
+
+# Pose landmarks the regions of interest are placed around, one region per group.
+HAND_POSE_LANDMARKS = (range(15, 23, 2), range(16, 23, 2))  # Wrist, pinky, index finger and thumb of each side
+FACE_POSE_LANDMARKS = (range(0, 11),)                        # Nose, eyes, ears and mouth
+
+
+class RoiDetector(LandmarkDetector):
+    """Run a hand or face detector on padded crops around the matching landmarks of the latest pose result.
+
+    Each crop is a square region of the frame around one group of landmarks (e.g. one wrist), resized to
+    `input_size`, so the detector processes far fewer pixels and small subjects fill more of its input.
+    The crops are placed side by side in a single image, or merged into one crop around every group when
+    they overlap. The landmarks are remapped to normalized coordinates of the full frame before they are
+    saved, so the results are interchangeable with those of `detector`. The full frame is used while the
+    pose detector has no result with the landmarks visible, and when a crop does not fit in the frame.
+    """
+    takes_mp_image = False
+
+    def __init__(self, detector: LandmarkDetector, pose: LandmarkDetector, pose_landmarks: tuple[range, ...],
+                 padding: float = 0.5, min_size: float = 0.1, input_size: int = 256, min_visibility: float = 0.5):
+        """
+        Args:
+            detector (LandmarkDetector): Hand or face detector run on the crops.
+            pose (LandmarkDetector): Pose detector whose latest result places the crops.
+            pose_landmarks (tuple[range, ...]): Groups of pose landmarks to crop around, e.g. `HAND_POSE_LANDMARKS`.
+            padding (float): Margin added on each side of the landmarks, relative to their extent.
+            min_size (float): Minimum side of the crop, relative to the shorter side of the frame.
+            input_size (int): Side [px] the crop is resized to.
+            min_visibility (float): Visibility for a pose landmark to be cropped around.
+        """
+        super().__init__()
+        self.__detector = detector
+        self.__pose = pose
+        self.__pose_landmarks = [list(group) for group in pose_landmarks]
+        self.__padding = padding
+        self.__min_size = min_size
+        self.__input_size = input_size
+        self.__min_visibility = min_visibility
+        # Crop regions and frame size per frame in flight, to remap its result.
+        self.__regions: dict[int, tuple[list[tuple[int, int, int, int]], tuple[int, int]]] = {}
+        self.__regions_lock = threading.Lock()
+        detector.add_listener(self.__on_result)
+
+    def inference(self, image, frame_timestamp_ms):
+        height, width = image.shape[:2]
+        regions = self.__crops(width, height)
+        if regions is None:
+            crop, regions = image, [(0, 0, width, height)]
+        else:
+            crop = np.hstack([cv2.resize(image[y:y + size, x:x + size], (self.__input_size, self.__input_size),
+                                         interpolation=cv2.INTER_AREA) for x, y, size, _ in regions])
+        with self.__regions_lock:
+            self.__regions[frame_timestamp_ms] = (regions, (width, height))
+        if self.__detector.takes_mp_image:
+            crop = mp.Image(image_format = mp.ImageFormat.SRGB, data = np.ascontiguousarray(crop))
+        self.__detector.submit(crop, frame_timestamp_ms)
+
+    def expire(self, before_ms: int) -> None:
+        self.__detector.expire(before_ms)
+        super().expire(before_ms)
+
+    def close(self) -> None:
+        self.__detector.close()
+
+    def __crops(self, width: int, height: int) -> list[tuple[int, int, int, int]] | None:
+        """Square crops (x, y, size, size) [px] around the groups of visible pose landmarks, or None without
+        any or when a crop does not fit in the frame height."""
+        raw_pose = self.__pose.results
+        if raw_pose is None or len(raw_pose.pose_landmarks) == 0:
+            return None
+        landmarks = landmarks_to_array(raw_pose.pose_landmarks[0])
+        groups = [landmarks[group] for group in self.__pose_landmarks]
+        groups = [group[group[:, 3] >= self.__min_visibility, 0:2] * (width, height) for group in groups]
+        groups = [group for group in groups if len(group) > 0]
+        if len(groups) == 0:
+            return None
+        crops = [self.__crop(group, width, height) for group in groups]
+        if None in crops:
+            return None
+        if len(crops) > 1 and any(_overlap(a, b) for i, a in enumerate(crops) for b in crops[i + 1:]):
+            # Overlapping crops would show the same subject twice, so one crop covers every group.
+            crops = [self.__crop(np.concatenate(groups), width, height)]
+        return None if None in crops else crops
+
+    def __crop(self, points: np.ndarray, width: int, height: int) -> tuple[int, int, int, int] | None:
+        low, high = points.min(axis=0), points.max(axis=0)
+        padded_extent = (high - low).max() * (1 + 2 * self.__padding)
+        frame_size = min(width, height)
+        if padded_extent > frame_size:
+            return None
+        size = int(max(padded_extent, self.__min_size * frame_size))
+        # The crop is shifted into the frame rather than clipped, so it stays square.
+        x, y = ((low + high) / 2 - size / 2).astype(int)
+        return int(np.clip(x, 0, width - size)), int(np.clip(y, 0, height - size)), size, size
+
+    def __on_result(self, timestamp_ms: int) -> None:
+        raw_results = next((results for history_timestamp_ms, results in reversed(self.__detector.history)
+                            if history_timestamp_ms == timestamp_ms), None)
+        with self.__regions_lock:
+            regions = self.__regions.pop(timestamp_ms, None)
+            # Results arrive in submission order, so the regions of earlier frames are not needed anymore.
+            for earlier_ms in [earlier_ms for earlier_ms in self.__regions if earlier_ms < timestamp_ms]:
+                del self.__regions[earlier_ms]
+        if raw_results is None or regions is None:
+            return
+        self._save_results(remap_tiled_results(pack_raw_results(raw_results), *regions), None, timestamp_ms)
+
+
+def _overlap(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> bool:
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
@@ -1,4 +1,8 @@
 from .exponential_smoothing import *
 from .landmark_filter import *
 from .one_euro_filter import OneEuroFilter
-from .gaussian_1d import Gaussian1dFilter
\ No newline at end of file
+from .gaussian_1d import Gaussian1dFilter
+from .kalman_filter import KalmanFilter
+from .filter_bank import FilterBank, FILTER_PARAMETERS
+from .forward_predictor import ForwardPredictor
+from .blendshape_filter import BlendshapeFilter
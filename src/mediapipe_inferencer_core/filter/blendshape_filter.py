@@ -0,0 +1,29 @@
+import numpy as np
+from mediapipe_inferencer_core.filter.exponential_smoothing import ExponentialSmoothing
+
+
+class BlendshapeFilter:
+    """Smooth face blendshape scores and suppress updates that stay within a dead-band.
+
+    When no score moved more than `dead_band` since the last emitted scores, `filter` returns None
+    so the frame can be sent without blendshapes.
+    """
+    def __init__(self, smoothing_factor:float, dead_band:float = 0.0) -> None:
+        self.__smoothing = ExponentialSmoothing(smoothing_factor)
+        self.__dead_band = dead_band
+        self.__emitted = None
+
+    @property
+    def result(self) -> np.ndarray:
+        """Last emitted scores."""
+        return self.__emitted
+
+    def filter(self, blendshapes:np.ndarray) -> np.ndarray:
+        if blendshapes is None or len(blendshapes) == 0:
+            return None
+        smoothed = self.__smoothing.filter_array(np.asarray(blendshapes, dtype=float))
+        if self.__emitted is not None and self.__emitted.shape == smoothed.shape \
+                and np.max(np.abs(smoothed - self.__emitted)) <= self.__dead_band:
+            return None
+        self.__emitted = smoothed
+        return smoothed
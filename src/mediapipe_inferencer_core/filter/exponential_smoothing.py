@@ -1,31 +1,35 @@
+import numpy as np
 from mediapipe_inferencer_core.data_class import LandmarkList, Landmark
-from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter
+from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter, _to_output
+from mediapipe_inferencer_core.util import float_util
 
 class ExponentialSmoothing(ILandmarkFilter):
     def __init__(self, smoothing_factor):
         super().__init__()
-        self.__smoothing_factor = smoothing_factor
-        self._prev_results = None
+        self.__smoothing_factor = float_util.clamp(smoothing_factor, 0, 1)
+        self._prev_values = None
+        self._difference = None
 
     @property
     def result(self)->LandmarkList:
-        return self._prev_results
+        return LandmarkList.from_array(self._prev_values) if self._prev_values is not None else None
 
-    def filter(self, results:LandmarkList):
-        if results is None:
-            return
-        filtered = results if self._prev_results is None else self._filter(results, self._prev_results, self.__smoothing_factor)
-        self._update_result_cache(filtered)
-        return filtered
+    def filter(self, results:LandmarkList, out:np.ndarray=None):
+        return self._filter_landmarks(results, out=out)
 
-    def _filter(self, current:LandmarkList, prev:LandmarkList, smoothing_factor:float)->LandmarkList:
-        if prev is None or len(prev.values) < 1:
-            return current
-        result = LandmarkList([ExponentialSmoothing._filter_per_landmark(current.value(i), prev.value(i), smoothing_factor) for i in range(len(current.values))])
-        return result
+    def filter_array(self, values:np.ndarray, out:np.ndarray=None) -> np.ndarray:
+        if self._prev_values is None or self._prev_values.shape != values.shape:
+            self._update_result_cache(LandmarkList.from_array(values))
+        else:
+            # prev += smoothing_factor * (current - prev), in place
+            np.subtract(values, self._prev_values, out=self._difference)
+            self._difference *= self.__smoothing_factor
+            self._prev_values += self._difference
+        return _to_output(self._prev_values, out)
 
     def _filter_per_landmark(current: Landmark, prev: Landmark, smoothing_factor:float)->Landmark:
         return Landmark.lerp(prev, current, smoothing_factor)
 
     def _update_result_cache(self, result: LandmarkList):
-        self._prev_results = result
\ No newline at end of file
+        self._prev_values = np.array(result.values, dtype=float)
+        self._difference = np.empty_like(self._prev_values)
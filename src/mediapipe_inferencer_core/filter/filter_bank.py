@@ -0,0 +1,165 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, HolisticFrame, LandmarkList, LandmarkBufferPool, SEGMENT_SIZES, get_segment, set_segment
+from mediapipe_inferencer_core.filter.one_euro_filter import one_euro_step
+from mediapipe_inferencer_core.filter.kalman_filter import kalman_reset, kalman_step
+
+# Segments sharing one settings.json entry (filter, prediction, ...).
+SEGMENT_GROUPS = {
+    'pose': ['pose_local', 'pose_world'],
+    'hand': ['left_hand_local', 'left_hand_world', 'right_hand_local', 'right_hand_world'],
+    'face': ['face_landmark'],
+}
+
+# Parameter names (in constructor order) and defaults of every algorithm the bank can run.
+FILTER_PARAMETERS = {
+    'one_euro': {'min_cutoff': 1.0, 'slope': 1.0, 'd_min_cutoff': 1.0},
+    'kalman':   {'process_noise': 1.0, 'measurement_noise': 1e-4},
+}
+
+
+class FilterBank:
+    """Filtering of every landmark stream of a frame in a single vectorized update.
+
+    The state of all segments lives in one concatenated buffer with per-row parameters,
+    so a whole `HolisticResults` is filtered with one kernel call instead of one filter per stream.
+    Each segment keeps its own timestamp, so a segment that is missing for some frames keeps its
+    state and resumes with the elapsed time since it was last seen, like a standalone filter.
+    """
+    def __init__(self, params:dict[str, tuple[float, ...]], algorithm:str = 'one_euro', pool:LandmarkBufferPool = None) -> None:
+        """
+        Args:
+            params (dict): Parameters per segment name of `SEGMENT_SIZES`, in the order of
+                `FILTER_PARAMETERS[algorithm]`. Segments that are not listed are passed through unfiltered.
+            algorithm (str): 'one_euro' (`OneEuroFilter`) or 'kalman' (`KalmanFilter`).
+            pool (LandmarkBufferPool): Pool the filtered landmarks are written to. New arrays are allocated by default.
+        """
+        self.__pool = pool
+        self.__segments: dict[str, slice] = {}
+        offset = 0
+        for name, size in SEGMENT_SIZES.items():
+            if name in params:
+                self.__segments[name] = slice(offset, offset + size)
+                offset += size
+        n_rows = offset
+        self.__params = {name: np.empty((n_rows, 1)) for name in FILTER_PARAMETERS[algorithm]}
+        for name, rows in self.__segments.items():
+            for param, value in zip(self.__params.values(), params[name]):
+                param[rows] = value
+        self.__kernel = _KalmanKernel(n_rows) if algorithm == 'kalman' else _OneEuroKernel(n_rows)
+        self.__current = np.zeros((n_rows, 4))
+        self.__filtered = np.zeros((n_rows, 4))
+        self.__prev_time = np.zeros((n_rows, 1))
+        self.__initialized = np.zeros(n_rows, dtype=bool)
+
+    @property
+    def segments(self) -> dict[str, slice]:
+        return self.__segments
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """(N, 3) velocity of the filtered landmarks of every row [unit/s], laid out like `segments`."""
+        return self.__kernel.state['velocity']
+
+    def filter(self, results:HolisticResults) -> HolisticResults:
+        """Filter every segment of `results` in place and return it."""
+        if results is None:
+            return results
+        present = np.zeros(len(self.__current), dtype=bool)
+        for name, rows in self.__segments.items():
+            landmarks = get_segment(results, name)
+            if landmarks is None or len(landmarks.values) != rows.stop - rows.start:
+                continue
+            self.__current[rows] = landmarks.values
+            present[rows] = True
+        filtered = self.__update(results.time, present)
+        for name, rows in self.__segments.items():
+            if present[rows.start]:
+                values = self.__pool.acquire(name) if self.__pool is not None else np.empty((rows.stop - rows.start, 4))
+                np.copyto(values, filtered[rows])
+                set_segment(results, name, LandmarkList.from_array(values))
+        return results
+
+    def filter_frame(self, frame:HolisticFrame) -> HolisticFrame:
+        """Filter the present segments of `frame` in place and return it."""
+        present = np.zeros(len(self.__current), dtype=bool)
+        for name, rows in self.__segments.items():
+            if frame.is_present(name):
+                self.__current[rows] = frame.segment(name)
+                present[rows] = True
+        filtered = self.__update(frame.time, present)
+        for name, rows in self.__segments.items():
+            if present[rows.start]:
+                frame.segment(name)[:] = filtered[rows]
+        return frame
+
+    def __update(self, time:float, present:np.ndarray) -> np.ndarray:
+        """Advance the rows marked `present` (measured in `self.__current`) and return the filtered rows.
+
+        The returned array is reused by the next update.
+        """
+        # Segments seen for the first time start from the measurement and pass it through.
+        first = present & ~self.__initialized
+        if first.any():
+            self.__kernel.reset(first, self.__current[first], {name: param[first] for name, param in self.__params.items()})
+            self.__prev_time[first] = time
+            self.__initialized |= first
+
+        t_e = time - self.__prev_time
+        active = present & (t_e[:, 0] >= 1e-5)
+        if active.all():
+            self.__kernel.step(self.__current, self.__kernel.state, t_e, self.__params)
+        elif active.any():
+            state = {name: value[active] for name, value in self.__kernel.state.items()}
+            self.__kernel.step(self.__current[active], state, t_e[active],
+                               {name: param[active] for name, param in self.__params.items()})
+            for name, value in state.items():
+                self.__kernel.state[name][active] = value
+        self.__prev_time[active] = time
+
+        filtered = self.__filtered
+        np.copyto(filtered, self.__current)
+        np.copyto(filtered, self.__kernel.state['position'], where=active[:, np.newaxis])
+        return filtered
+
+
+class _OneEuroKernel:
+    def __init__(self, n_rows:int) -> None:
+        self.state = {
+            'position':   np.zeros((n_rows, 4)),
+            'derivative': np.zeros((n_rows, 4)),
+            'velocity':   np.zeros((n_rows, 3)),
+        }
+
+    def reset(self, rows:np.ndarray, current:np.ndarray, params:dict) -> None:
+        self.state['position'][rows] = current
+        self.state['derivative'][rows] = (0, 0, 0, 1)
+        self.state['velocity'][rows] = 0
+
+    def step(self, current:np.ndarray, state:dict, t_e:np.ndarray, params:dict) -> None:
+        # The One Euro derivative only drives the cutoff, so the velocity is taken from the filtered output.
+        velocity = state['velocity']
+        np.negative(state['position'][:, 0:3], out=velocity)
+        one_euro_step(current, state['position'], state['derivative'], 1/t_e,
+                      params['min_cutoff'], params['slope'], params['d_min_cutoff'])
+        velocity += state['position'][:, 0:3]
+        velocity /= t_e
+
+
+class _KalmanKernel:
+    def __init__(self, n_rows:int) -> None:
+        self.state = {
+            'position':   np.zeros((n_rows, 4)),
+            'velocity':   np.zeros((n_rows, 3)),
+            'covariance': np.zeros((n_rows, 3)),
+        }
+
+    def reset(self, rows:np.ndarray, current:np.ndarray, params:dict) -> None:
+        covariance = np.empty((len(current), 3))
+        kalman_reset(current, covariance, params['measurement_noise'])
+        self.state['position'][rows] = current
+        self.state['velocity'][rows] = 0
+        self.state['covariance'][rows] = covariance
+
+    def step(self, current:np.ndarray, state:dict, t_e:np.ndarray, params:dict) -> None:
+        kalman_step(current, state['position'], state['velocity'], state['covariance'], t_e,
+                    params['process_noise'], params['measurement_noise'])
@@ -0,0 +1,52 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList, LandmarkBufferPool, get_segment, set_segment
+from mediapipe_inferencer_core.filter.filter_bank import FilterBank
+
+
+class ForwardPredictor:
+    """Extrapolate filtered landmarks along the velocity estimated by a `FilterBank`.
+
+    Every landmark is moved by `velocity * (horizon + latency)`, where the latency is the time
+    elapsed between capture and sending when latency compensation is enabled. The displacement
+    of each landmark is clamped to `max_displacement` so fast motion does not overshoot.
+    """
+    def __init__(self, bank:FilterBank, params:dict[str, tuple[float, float]], compensate_latency:bool = True,
+                 pool:LandmarkBufferPool = None) -> None:
+        """
+        Args:
+            bank (FilterBank): Bank that filters the results passed to `predict`.
+            params (dict): (horizon [s], max_displacement [unit]) per segment name.
+                Segments that are not listed are not extrapolated.
+            compensate_latency (bool): Also extrapolate over the time between capture and `predict`.
+            pool (LandmarkBufferPool): Pool the predicted landmarks are written to. New arrays are allocated by default.
+        """
+        self.__pool = pool
+        self.__bank = bank
+        self.__compensate_latency = compensate_latency
+        n_rows = len(bank.velocity)
+        self.__horizon = np.zeros((n_rows, 1))
+        self.__max_displacement = np.full((n_rows, 1), np.inf)
+        self.__segments = {}
+        for name, rows in bank.segments.items():
+            if name in params:
+                self.__horizon[rows], self.__max_displacement[rows] = params[name]
+                self.__segments[name] = rows
+        self.__displacement = np.zeros((n_rows, 3))
+
+    def predict(self, results:HolisticResults, send_time:float) -> HolisticResults:
+        """Replace the filtered segments of `results` with their prediction at `send_time` and return it."""
+        if results is None:
+            return results
+        lead_time = self.__horizon + (max(send_time - results.time, 0) if self.__compensate_latency else 0)
+        displacement = np.multiply(self.__bank.velocity, lead_time, out=self.__displacement)
+        distance = np.linalg.norm(displacement, axis=1, keepdims=True)
+        displacement *= np.minimum(1, self.__max_displacement / np.maximum(distance, 1e-12))
+        for name, rows in self.__segments.items():
+            landmarks = get_segment(results, name)
+            if landmarks is None or len(landmarks.values) != rows.stop - rows.start:
+                continue
+            predicted = self.__pool.acquire(name) if self.__pool is not None else np.empty_like(landmarks.values)
+            np.copyto(predicted, landmarks.values)
+            predicted[:, 0:3] += displacement[rows]
+            set_segment(results, name, LandmarkList.from_array(predicted))
+        return results
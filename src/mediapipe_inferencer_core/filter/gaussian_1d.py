@@ -1,43 +1,50 @@
 import numpy as np
 from scipy.ndimage import gaussian_filter1d
 from .landmark_filter import ILandmarkFilter
-from mediapipe_inferencer_core.data_class import Landmark, LandmarkList
+from mediapipe_inferencer_core.data_class import LandmarkList
 
 class Gaussian1dFilter(ILandmarkFilter):
     def __init__(self, sigma:float, window_size:int, n_landmarks:int)->None:
         self._sigma = sigma
         self._window_size = window_size if window_size % 2 == 1 else window_size - 1
         self._n_landmarks = n_landmarks
-        self._prev= []
+        # ring buffer of the latest frames; `_head` is the slot written next
+        self._history = np.zeros((self._window_size, n_landmarks, 4))
+        self._head = 0
+        self._count = 0
+        self._kernels = [Gaussian1dFilter._center_weights(sigma, length) for length in range(1, self._window_size + 1)]
+        self._result = None
 
     @property
-    def result(self):
-        pass
-
-    def filter(self, current: LandmarkList)->LandmarkList:
-        if current is None:
-            return current
-        self._push(current)
-        # filtering with Gaussian 1d
-        center = len(self._prev) // 2
-        view = np.array(self._prev).transpose(2, 1, 0)
-        filtered_x          = [gaussian_filter1d(x, self._sigma)[center] for x in view[0, :, :]]
-        filtered_y          = [gaussian_filter1d(y, self._sigma)[center] for y in view[1, :, : ]]
-        filtered_z          = [gaussian_filter1d(z, self._sigma)[center] for z in view[2, :, :]]
-        filtered_confidence = [gaussian_filter1d(confidence, self._sigma)[center] for confidence in view[3, :, :]]
-        # packing results as LandmarkList
-        filtered_result = LandmarkList(
-                [
-                    Landmark(filtered_x[i], filtered_y[i], filtered_z[i], filtered_confidence[i]) for i in range(self._n_landmarks)
-                ]
-            )
-        return filtered_result
-
-    def _push(self, result: LandmarkList)->None:
-        current = np.copy(result.values)
-        self._prev.append(current)
-        if len(self._prev) > self._window_size:
-            self._pop()
-
-    def _pop(self)->LandmarkList:
-        self._prev = self._prev[1:]
\ No newline at end of file
+    def result(self)->LandmarkList:
+        return self._result
+
+    def filter(self, current: LandmarkList, out:np.ndarray=None)->LandmarkList:
+        return self._filter_landmarks(current, out=out)
+
+    def filter_array(self, values:np.ndarray, out:np.ndarray=None)->np.ndarray:
+        self._push(values)
+        filtered = np.einsum('w,wnc->nc', self._slot_weights(), self._history, out=out)
+        self._result = LandmarkList.from_array(filtered)
+        return filtered
+
+    def _push(self, values: np.ndarray)->None:
+        self._history[self._head] = values
+        self._head = (self._head + 1) % self._window_size
+        self._count = min(self._count + 1, self._window_size)
+
+    def _slot_weights(self)->np.ndarray:
+        """Center-sample weights of the current history, reordered to match the ring slots."""
+        kernel = self._kernels[self._count - 1]
+        if self._count < self._window_size:
+            weights = np.zeros(self._window_size)
+            weights[:self._count] = kernel
+            return weights
+        return np.roll(kernel, self._head)
+
+    def _center_weights(sigma:float, length:int)->np.ndarray:
+        """Weights w such that `gaussian_filter1d(x, sigma)[length // 2] == w @ x` for any x of `length` samples.
+
+        Filtering the unit impulses keeps the boundary handling of `gaussian_filter1d` (reflect) intact.
+        """
+        return gaussian_filter1d(np.eye(length), sigma, axis=1)[:, length // 2]
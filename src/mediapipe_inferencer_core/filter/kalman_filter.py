@@ -0,0 +1,98 @@
+from mediapipe_inferencer_core.data_class import LandmarkList
+from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter, _to_output
+import numpy as np
+
+# Prior variance of the velocity of a landmark that has just appeared [(unit/s)^2].
+INITIAL_VELOCITY_VARIANCE = 1.0
+
+class KalmanFilter(ILandmarkFilter):
+    """Constant-velocity Kalman filter run for all landmarks at once.
+
+    Every landmark axis is tracked as an independent (position, velocity) state. The landmark
+    confidence scales the measurement noise, so low-visibility landmarks follow the motion model
+    more than the measurement. The confidence channel itself is passed through.
+    """
+    def __init__(self, process_noise:float, measurement_noise:float) -> None:
+        """
+        Args:
+            process_noise (float): Spectral density of the white-noise acceleration.
+            measurement_noise (float): Measurement variance of a landmark with confidence 1.
+        """
+        super().__init__()
+        self.__process_noise = process_noise
+        self.__measurement_noise = measurement_noise
+        self.__prev_time = 0
+        self.__position = None
+        self.__velocity = None
+        self.__covariance = None
+
+    @property
+    def result(self) -> LandmarkList:
+        return LandmarkList.from_array(self.__position) if self.__position is not None else None
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """Estimated (N, 3) velocity of every landmark [unit/s]."""
+        return self.__velocity
+
+    def predict(self, horizon:float) -> np.ndarray:
+        """Extrapolate the filtered (N, 4) landmarks `horizon` seconds ahead."""
+        predicted = self.__position.copy()
+        predicted[:, 0:3] += self.__velocity * horizon
+        return predicted
+
+    def filter(self, current:LandmarkList, time:float, out:np.ndarray=None) -> LandmarkList:
+        return self._filter_landmarks(current, time, out=out)
+
+    def filter_array(self, values:np.ndarray, time:float, out:np.ndarray=None) -> np.ndarray:
+        if self.__position is None or self.__position.shape != values.shape:
+            self.__position = np.array(values, dtype=float)
+            self.__velocity = np.zeros((len(values), 3))
+            self.__covariance = np.empty((len(values), 3))
+            kalman_reset(values, self.__covariance, self.__measurement_noise)
+            self.__prev_time = time
+            return values if out is None else _to_output(values, out)
+        t_e = time - self.__prev_time
+        if t_e < 1e-5:
+            return values if out is None else _to_output(values, out)
+        kalman_step(values, self.__position, self.__velocity, self.__covariance, t_e,
+                    self.__process_noise, self.__measurement_noise)
+        self.__prev_time = time
+        return _to_output(self.__position, out)
+
+
+def kalman_reset(current:np.ndarray, covariance:np.ndarray, measurement_noise) -> None:
+    """Initialize the (N, 3) covariance rows [P_pp, P_pv, P_vv] of landmarks first seen at `current`."""
+    covariance[:, 0:1] = _measurement_variance(current, measurement_noise)
+    covariance[:, 1] = 0
+    covariance[:, 2] = INITIAL_VELOCITY_VARIANCE
+
+def kalman_step(current:np.ndarray, position:np.ndarray, velocity:np.ndarray, covariance:np.ndarray, dt, process_noise, measurement_noise) -> None:
+    """Advance the constant-velocity state of N landmarks by `dt` seconds and fuse `current`, in place.
+
+    The covariance is shared by the three axes of a landmark since the motion model and the
+    measurement noise do not depend on the axis. `dt` and the parameters may be scalars or (N, 1) arrays.
+    """
+    p_pp, p_pv, p_vv = covariance[:, 0:1], covariance[:, 1:2], covariance[:, 2:3]
+    # predict
+    position[:, 0:3] += velocity * dt
+    p_pp += dt * (2 * p_pv + dt * p_vv) + process_noise * dt**3 / 3
+    p_pv += dt * p_vv + process_noise * dt**2 / 2
+    p_vv += process_noise * dt
+    # update
+    innovation_variance = p_pp + _measurement_variance(current, measurement_noise)
+    position_gain = p_pp / innovation_variance
+    velocity_gain = p_pv / innovation_variance
+    innovation = current[:, 0:3] - position[:, 0:3]
+    position[:, 0:3] += position_gain * innovation
+    velocity += velocity_gain * innovation
+    p_vv -= velocity_gain * p_pv
+    p_pv *= 1 - position_gain
+    p_pp *= 1 - position_gain
+    position[:, 3] = current[:, 3]
+
+def _measurement_variance(current:np.ndarray, measurement_noise):
+    # A confidence of 0 means the model reports none (e.g. face mesh), not that the landmark is invisible.
+    confidence = current[:, 3:4]
+    confidence = np.clip(np.where(confidence > 0, confidence, 1), 1e-3, 1)
+    return measurement_noise / confidence
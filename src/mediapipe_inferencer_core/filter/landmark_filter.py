@@ -1,10 +1,48 @@
 from abc import ABC, abstractclassmethod, abstractproperty
+import numpy as np
 from mediapipe_inferencer_core.data_class import LandmarkList
 
 class ILandmarkFilter(ABC):
     @abstractclassmethod
     def filter(self, results:LandmarkList):
         pass
+    @abstractclassmethod
+    def filter_array(self, values:np.ndarray, out:np.ndarray=None) -> np.ndarray:
+        """Filter an (N, 4) array of [x, y, z, confidence] rows.
+
+        The result is written into `out` when given, so filters can be chained without intermediate objects.
+        """
+        pass
     @abstractproperty
     def result(self):
-        pass
\ No newline at end of file
+        pass
+
+    def filter_sequence(self, values:np.ndarray, *args) -> np.ndarray:
+        """Filter a (T, N, 4) landmark sequence and return the filtered (T, N, 4) sequence.
+
+        Extra arguments of `filter_array` (e.g. the timestamps of time-based filters) are passed as
+        length-T sequences. The filter state carries over, so the output is exactly what calling
+        `filter` frame by frame would produce.
+        """
+        filtered = np.empty(np.shape(values))
+        for t, current in enumerate(values):
+            # Assigned as well, in case a filter returns its result without writing `out`.
+            filtered[t] = self.filter_array(current, *(arg[t] for arg in args), out=filtered[t])
+        return filtered
+
+    def _filter_landmarks(self, current, *args, out:np.ndarray=None):
+        """Run `filter_array` on either a raw (N, 4) array or a `LandmarkList`, returning the same type."""
+        if current is None:
+            return current
+        if isinstance(current, np.ndarray):
+            return self.filter_array(current, *args, out=out)
+        filtered = self.filter_array(current.values, *args, out=out)
+        return current if filtered is current.values else LandmarkList.from_array(filtered)
+
+
+def _to_output(values:np.ndarray, out:np.ndarray=None) -> np.ndarray:
+    """Copy `values` into `out`, or into a new array when no buffer is given."""
+    if out is None:
+        return values.copy()
+    np.copyto(out, values)
+    return out
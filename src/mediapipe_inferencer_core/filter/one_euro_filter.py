@@ -1,28 +1,54 @@
 from mediapipe_inferencer_core.data_class import Landmark, LandmarkList
-from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter
+from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter, _to_output
 from mediapipe_inferencer_core.filter.exponential_smoothing import ExponentialSmoothing
 import math
 import numpy as np
 
 class OneEuroFilter(ILandmarkFilter):
-    def __init__(self, min_cutoff:float, slope:float, d_cutoff:float) -> None:
+    def __init__(self, min_cutoff:float, slope:float, d_cutoff:float, vectorized:bool = False) -> None:
+        """
+        Args:
+            vectorized (bool): Keep the filter state as (N, 4) arrays and update all landmarks
+                in one NumPy pass instead of running the per-landmark path.
+        """
         super().__init__()
         self.__prev_time = 0
         self.__min_cutoff = min_cutoff
         self.__slope = slope
         self.__d_cutoff = d_cutoff
+        self.__vectorized = vectorized
         self.__position_filter = PerLandmarkFilter()
         self.__velocity_filter = PerLandmarkFilter()
+        self.__position = None
+        self.__derivative = None
         self.__is_first = True
         self.__is_first_2 = True
 
     @property
     def result(self)-> LandmarkList:
+        if self.__vectorized:
+            return LandmarkList.from_array(self.__position) if self.__position is not None else None
         return self.__position_filter.result
 
-    def filter(self, current:LandmarkList, time:float) -> LandmarkList:
-        if current is None:
-            return current
+    def filter(self, current:LandmarkList, time:float, out:np.ndarray=None) -> LandmarkList:
+        return self._filter_landmarks(current, time, out=out)
+
+    def filter_array(self, values:np.ndarray, time:float, out:np.ndarray=None) -> np.ndarray:
+        if not self.__vectorized:
+            filtered = self._filter_landmark_list(LandmarkList.from_array(values), time).values
+            return filtered if out is None else _to_output(filtered, out)
+        if self.__position is None or self.__position.shape != values.shape:
+            self.__position = np.array(values, dtype=float)
+            self.__derivative = np.zeros_like(self.__position)
+            self.__derivative[:, 3] = 1
+        t_e = time - self.__prev_time
+        if t_e < 1e-5:
+            return values if out is None else _to_output(values, out)
+        one_euro_step(values, self.__position, self.__derivative, 1/t_e, self.__min_cutoff, self.__slope, self.__d_cutoff)
+        self.__prev_time = time
+        return _to_output(self.__position, out)
+
+    def _filter_landmark_list(self, current:LandmarkList, time:float) -> LandmarkList:
         if self.__is_first_2:
             self.__position_filter.init_cache(current)
             self.__velocity_filter.init_cache(LandmarkList([Landmark(0,0,0,1) for _ in range(len(current.values))]))
@@ -56,6 +82,29 @@ class OneEuroFilter(ILandmarkFilter):
         return 1 / (1 + time_constant*update_rate)
 
 
+def one_euro_step(current:np.ndarray, position:np.ndarray, derivative:np.ndarray, update_rate, min_cutoff, slope, d_cutoff) -> None:
+    """Advance the One Euro state of N landmarks by one frame, updating `position` and `derivative` in place.
+
+    Mirrors `OneEuroFilter._filter` row by row: the derivative is blended from the previous position,
+    so the cutoff (and therefore the tuned parameters in settings.json) behaves exactly like the per-landmark path.
+    `update_rate` and the parameters may be scalars or (N, 1) arrays.
+    """
+    dx = np.subtract(current, position)
+    dx *= update_rate
+    dx[:, 3] = np.minimum(current[:, 3], position[:, 3])
+    alpha_d = _alpha(update_rate, d_cutoff)
+    np.subtract(dx, position, out=derivative)
+    derivative *= alpha_d
+    derivative += position
+    cutoff = min_cutoff + slope * np.linalg.norm(derivative[:, 0:3], axis=1, keepdims=True)
+    alpha = _alpha(update_rate, cutoff)
+    position += alpha * (current - position)
+
+def _alpha(update_rate, cutoff):
+    time_constant = 1 / (2*np.pi*cutoff)
+    return 1 / (1 + time_constant*update_rate)
+
+
 class PerLandmarkFilter(ExponentialSmoothing):
     def __init__(self):
         dummy = 1
@@ -63,7 +112,7 @@ class PerLandmarkFilter(ExponentialSmoothing):
 
     def update(self, result:Landmark, index:int)->None:
         tmp = np.array([result.x, result.y, result.z, result.confidence])
-        self._prev_results.values[index] = tmp
+        self._prev_values[index] = tmp
 
     def init_cache(self, new_result:LandmarkList)->None:
-        self._update_result_cache(new_result)
\ No newline at end of file
+        self._update_result_cache(new_result)
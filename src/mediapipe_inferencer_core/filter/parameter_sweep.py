@@ -0,0 +1,123 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import itertools
+import numpy as np
+from scipy.ndimage import gaussian_filter1d
+from mediapipe_inferencer_core.filter.landmark_filter import ILandmarkFilter
+from mediapipe_inferencer_core.filter.one_euro_filter import OneEuroFilter
+from mediapipe_inferencer_core.filter.kalman_filter import KalmanFilter
+from mediapipe_inferencer_core.filter.filter_bank import FILTER_PARAMETERS, SEGMENT_GROUPS
+from mediapipe_inferencer_core.landmark_recorder import load_landmark_recording
+
+
+def create_filter(algorithm: str, params: tuple[float, ...]) -> ILandmarkFilter:
+    """Create the filter the FilterBank runs for `algorithm`, so tuned parameters mean the same thing."""
+    if algorithm == 'kalman':
+        return KalmanFilter(*params)
+    return OneEuroFilter(*params, vectorized=True)
+
+
+@dataclass
+class SweepResult:
+    group: str
+    params: tuple[float, ...]
+    swept: tuple[str, ...]
+    jitter: float
+    lag: float
+    score: float
+
+
+def jitter(sequence: np.ndarray) -> float:
+    """RMS of the second difference of (T, N, 3) positions, i.e. the frame-to-frame acceleration."""
+    acceleration = sequence[2:] - 2 * sequence[1:-1] + sequence[:-2]
+    return float(np.sqrt(np.mean(np.sum(acceleration**2, axis=-1))))
+
+
+def lag(sequence: np.ndarray, reference: np.ndarray) -> float:
+    """Mean distance between filtered positions and the zero-phase smoothed raw positions."""
+    return float(np.mean(np.linalg.norm(sequence - reference, axis=-1)))
+
+
+def evaluate(algorithm: str, params: tuple[float, ...], values: np.ndarray, time: np.ndarray, reference_sigma: float) -> tuple[float, float, float, float]:
+    """Filter one (T, N, 4) segment sequence and return (jitter, lag, raw jitter, raw lag).
+
+    Frames in which the segment is missing (NaN) are skipped, so the filter sees the same
+    sequence of measurements and time steps as in production.
+    """
+    present = ~np.isnan(values).any(axis=(1, 2))
+    values, time = values[present].astype(float), time[present]
+    if len(values) < 3:
+        return (np.nan, np.nan, np.nan, np.nan)
+    filtered = create_filter(algorithm, params).filter_sequence(values, time)
+    reference = gaussian_filter1d(values[:, :, 0:3], reference_sigma, axis=0)
+    return (
+        jitter(filtered[:, :, 0:3]),
+        lag(filtered[:, :, 0:3], reference),
+        jitter(values[:, :, 0:3]),
+        lag(values[:, :, 0:3], reference)
+    )
+
+
+_recordings = []
+
+def _load_recordings(file_paths: list[str]) -> None:
+    global _recordings
+    _recordings = [load_landmark_recording(path) for path in file_paths]
+
+def _evaluate_task(algorithm: str, group: str, params: tuple[float, ...], swept: tuple[str, ...],
+                   reference_sigma: float, lag_weight: float) -> SweepResult:
+    metrics = np.array([
+        evaluate(algorithm, params, recording[segment], recording['time'], reference_sigma)
+        for recording in _recordings for segment in SEGMENT_GROUPS[group]
+    ])
+    jitter_value, lag_value, raw_jitter, raw_lag = np.nanmean(metrics, axis=0) if not np.isnan(metrics).all() else [np.nan] * 4
+    # both metrics are relative to the raw stream so the weight does not depend on the coordinate unit
+    score = jitter_value / raw_jitter + lag_weight * lag_value / raw_lag
+    return SweepResult(group, params, swept, jitter_value, lag_value, score)
+
+
+def group_parameters(config: dict, algorithm: str, group: str) -> dict[str, float]:
+    """Parameters of `group` in the settings.json filter schema: the group values over "default", over `FILTER_PARAMETERS`."""
+    filter_config = (config or {}).get("filter", {})
+    merged = {**filter_config.get("default", {}), **filter_config.get(group, {})}
+    return {name: merged.get(name, default) for name, default in FILTER_PARAMETERS[algorithm].items()}
+
+
+def sweep(file_paths: list[str], algorithm: str, grids: dict[str, list[float]], groups: list[str],
+          reference_sigma: float = 2.0, lag_weight: float = 1.0, max_workers: int = None,
+          config: dict = None) -> dict[str, list[SweepResult]]:
+    """Evaluate every parameter combination of `grids` for each segment group across a process pool.
+
+    Args:
+        grids (dict): Candidate values per parameter name of `FILTER_PARAMETERS[algorithm]`;
+            parameters without candidates keep their value in `config`.
+        config (dict): Settings (settings.json schema) the parameters that are not swept are taken from.
+            The defaults of `FILTER_PARAMETERS` by default.
+    Returns:
+        dict: Results per group, best (lowest score) first.
+    """
+    unknown = [name for name in grids if name not in FILTER_PARAMETERS[algorithm]]
+    if unknown:
+        raise ValueError(f"unknown {algorithm} parameters: {', '.join(unknown)}")
+    swept = tuple(name for name in FILTER_PARAMETERS[algorithm] if name in grids)
+    tasks = []
+    for group in groups:
+        candidates = [grids.get(name, [value]) for name, value in group_parameters(config, algorithm, group).items()]
+        tasks += [(group, params) for params in itertools.product(*candidates)]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_load_recordings, initargs=(file_paths,)) as executor:
+        futures = [executor.submit(_evaluate_task, algorithm, group, params, swept, reference_sigma, lag_weight) for group, params in tasks]
+        results = [future.result() for future in futures]
+    return {
+        group: sorted((r for r in results if r.group == group and not np.isnan(r.score)), key=lambda r: r.score)
+        for group in groups
+    }
+
+
+def apply_to_config(config: dict, algorithm: str, best: dict[str, SweepResult]) -> dict:
+    """Write the best values of the swept parameters of each group into the settings.json filter schema."""
+    filter_config = config.setdefault("filter", {})
+    filter_config["algorithm"] = algorithm
+    for group, result in best.items():
+        params = dict(zip(FILTER_PARAMETERS[algorithm], result.params))
+        filter_config.setdefault(group, {}).update({name: params[name] for name in result.swept})
+    return config
@@ -0,0 +1,42 @@
+import cv2
+import numpy as np
+from mediapipe_inferencer_core.packer.remap_landmarks import letterbox_region
+
+
+class InputResizer:
+    """Resize frames once to the resolution the detectors run at, instead of letting every detector resample them.
+
+    A stretched frame keeps the normalized landmark coordinates of the original frame. A letterboxed frame
+    keeps the aspect ratio and pads the rest with black, so its landmarks have to be remapped with the
+    region `resize` returns (see `remap_results`).
+    """
+    def __init__(self, size: tuple[int, int], letterbox: bool = False):
+        """
+        Args:
+            size (tuple): (width, height) [px] of the resized frames.
+            letterbox (bool): Keep the aspect ratio of the frames and pad them to `size` instead of stretching them.
+        """
+        self.__width, self.__height = size
+        self.__letterbox = letterbox
+
+    def resize(self, image: np.ndarray) -> tuple[np.ndarray, tuple[float, float, float, float] | None]:
+        """Resize `image` to the inference resolution.
+
+        Returns:
+            tuple: The resized image, and the region (x, y, width, height) [px] of `image` it covers,
+                or None when the normalized coordinates are the same in both images.
+        """
+        height, width = image.shape[:2]
+        if (width, height) == (self.__width, self.__height):
+            return image, None
+        if not self.__letterbox:
+            return cv2.resize(image, (self.__width, self.__height), interpolation=_interpolation(width, self.__width)), None
+        (x, y, content_width, content_height), region = letterbox_region((width, height), (self.__width, self.__height))
+        resized = np.zeros((self.__height, self.__width, *image.shape[2:]), dtype=image.dtype)
+        resized[y:y + content_height, x:x + content_width] = cv2.resize(
+            image, (content_width, content_height), interpolation=_interpolation(width, content_width))
+        return resized, region
+
+
+def _interpolation(size: int, resized_size: int) -> int:
+    return cv2.INTER_AREA if resized_size < size else cv2.INTER_LINEAR
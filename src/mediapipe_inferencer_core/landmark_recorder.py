@@ -0,0 +1,39 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, SEGMENT_SIZES, get_segment
+
+
+class LandmarkRecorder:
+    """Record raw landmark streams frame by frame and save them as a .npz file.
+
+    File format:
+        time: (T,) float64 frame times [s]
+        <segment>: (T, N, 4) float32 landmarks per segment name of `SEGMENT_SIZES`,
+            NaN for frames in which the segment was not detected.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        self._time = []
+        self._segments = {name: [] for name in SEGMENT_SIZES}
+
+    def append(self, results: HolisticResults) -> None:
+        self._time.append(results.time)
+        for name, size in SEGMENT_SIZES.items():
+            landmarks = get_segment(results, name)
+            if landmarks is None or len(landmarks.values) != size:
+                self._segments[name].append(np.full((size, 4), np.nan, dtype=np.float32))
+            else:
+                self._segments[name].append(np.array(landmarks.values, dtype=np.float32))
+
+    def save(self) -> None:
+        np.savez_compressed(
+            self._file_path,
+            time=np.array(self._time),
+            **{name: np.array(frames).reshape(-1, SEGMENT_SIZES[name], 4) for name, frames in self._segments.items()}
+        )
+
+
+def load_landmark_recording(file_path: str) -> dict[str, np.ndarray]:
+    """Load a file written by `LandmarkRecorder` as {'time': (T,), <segment>: (T, N, 4)}."""
+    with np.load(file_path) as recording:
+        return {name: recording[name] for name in recording.files}
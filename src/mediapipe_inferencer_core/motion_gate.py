@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class MotionGate:
+    """Tell which detectors can skip a frame because their region of the image has not changed.
+
+    Frames are compared as grayscale images subsampled every `step` pixels, against the frame the
+    detector last ran on, so slow motion accumulates until it passes `threshold`. A detector is never
+    skipped more than `max_skips` frames in a row, so its tracking does not go stale.
+    """
+    def __init__(self, threshold: float = 3.0, max_skips: int = 5, step: int = 8, regions: bool = True):
+        """
+        Args:
+            threshold (float): Mean absolute difference of the gray levels (0-255) under which a region is static.
+            max_skips (int): Consecutive frames a detector may skip.
+            step (int): Subsampling step [px] of the compared frames.
+            regions (bool): Compare only the region given for a part (e.g. around the last known hands)
+                instead of the whole frame.
+        """
+        self.__threshold = threshold
+        self.__max_skips = max_skips
+        self.__step = step
+        self.__regions = regions
+        self.__references: dict[str, np.ndarray] = {}
+        self.__skips: dict[str, int] = {}
+
+    def downscale(self, image: np.ndarray) -> np.ndarray:
+        """Grayscale frame to compare, subsampled from an RGB image."""
+        return image[::self.__step, ::self.__step].mean(axis=2, dtype=np.float32)
+
+    def is_static(self, part: str, frame: np.ndarray, region: tuple[float, float, float, float] = None) -> bool:
+        """Whether the detector of `part` can skip `frame`, counting the skip if it can.
+
+        Args:
+            frame (np.ndarray): Frame made by `downscale`.
+            region (tuple): Normalized (x0, y0, x1, y1) region to compare. The whole frame by default.
+        """
+        reference = self.__references.get(part)
+        if reference is None or reference.shape != frame.shape or self.__skips[part] >= self.__max_skips:
+            return False
+        height, width = frame.shape
+        x0, y0, x1, y1 = region if region is not None and self.__regions else (0.0, 0.0, 1.0, 1.0)
+        window = (_span(y0, y1, height), _span(x0, x1, width))
+        difference = np.abs(frame[window] - reference[window]).mean()
+        if difference >= self.__threshold:
+            return False
+        self.__skips[part] += 1
+        return True
+
+    def mark_submitted(self, part: str, frame: np.ndarray) -> None:
+        """Make `frame` the reference of `part`, once its detector runs on it."""
+        self.__references[part] = frame
+        self.__skips[part] = 0
+
+
+def _span(low: float, high: float, size: int) -> slice:
+    """Pixels covered by the normalized interval [low, high], at least one."""
+    start = min(int(low * size), size - 1)
+    return slice(start, max(int(np.ceil(high * size)), start + 1))
+
+
+def landmark_region(*landmarks: np.ndarray, padding: float = 0.2) -> tuple[float, float, float, float] | None:
+    """Normalized (x0, y0, x1, y1) bounding box of (N, 4) image landmark arrays, padded by `padding` of its
+    size on each side and clipped to the image. None without any landmark."""
+    points = [values[:, 0:2] for values in landmarks if values is not None and len(values) > 0]
+    if not points:
+        return None
+    points = np.concatenate(points)
+    low, high = points.min(axis=0), points.max(axis=0)
+    margin = (high - low) * padding
+    x0, y0 = np.clip(low - margin, 0.0, 1.0)
+    x1, y1 = np.clip(high + margin, 0.0, 1.0)
+    return float(x0), float(y0), float(x1), float(y1)
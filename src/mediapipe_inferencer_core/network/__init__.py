@@ -2,4 +2,5 @@ from .holistic_pose_sender import *
 from .udp_client import *
 from .estimation_state import EstimationState, LandmarkVisualizationSettings
 from .estimation_control_servicer import EstimationControlServicer
-from .estimation_control_server import EstimationControlServer
\ No newline at end of file
+from .estimation_control_server import EstimationControlServer
+from .output_scheduler import OutputScheduler
@@ -1,11 +1,12 @@
 from mediapipe_inferencer_core.network.udp_client import UdpClient
 from mediapipe_inferencer_core.packer.packer_for_sending import pack_holistic_landmarks_result
-from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList, Landmark
-import copy
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList, LandmarkBufferPool, SEGMENT_SIZES
+import numpy as np
 
 class HolisticPoseSender:
-    def __init__(self, address=None, port=None):
+    def __init__(self, address=None, port=None, pool:LandmarkBufferPool=None):
         self.client = UdpClient(address, port)
+        self.pool = pool
 
     def connect(self):
         self.client.connect()
@@ -16,18 +17,31 @@ class HolisticPoseSender:
         Args:
             holistic_results (HolisticLandmarks): Packed results of MediaPipe Pose, Hands and Face.
         """
-        result = copy.deepcopy(holistic_results)
+        result = holistic_results.snapshot()
+        transformed = []
         if holistic_results.pose is not None and holistic_results.pose.world is not None:
-            result.pose.world = transform_coordinate(holistic_results.pose.world)
+            result.pose.world = self.__transform(holistic_results.pose.world, 'pose_world', transformed)
         if holistic_results.hand.left is not None and holistic_results.hand.left.world is not None:
-            result.hand.left.world = transform_coordinate(holistic_results.hand.left.world)
+            result.hand.left.world = self.__transform(holistic_results.hand.left.world, 'left_hand_world', transformed)
         if holistic_results.hand.right is not None and holistic_results.hand.right.world is not None:
-            result.hand.right.world = transform_coordinate(holistic_results.hand.right.world)
+            result.hand.right.world = self.__transform(holistic_results.hand.right.world, 'right_hand_world', transformed)
         packed_results = pack_holistic_landmarks_result(result)
+        if self.pool is not None:
+            for values in transformed:
+                self.pool.release(values)
         msg = packed_results.SerializeToString()
         return self.client.send_protobuf_message(msg)
 
+    def __transform(self, landmarks: LandmarkList, name: str, transformed: list) -> LandmarkList:
+        out = None
+        if self.pool is not None and len(landmarks.values) == SEGMENT_SIZES[name]:
+            out = self.pool.acquire(name)
+            transformed.append(out)
+        return transform_coordinate(landmarks, out)
 
-def transform_coordinate(result: LandmarkList):
-    return LandmarkList(Landmark(-lm[0], -lm[1], -lm[2], lm[3]) for lm in result.values)
+
+def transform_coordinate(result: LandmarkList, out: np.ndarray = None):
+    values = np.negative(result.values, out=out)
+    values[:, 3] = result.values[:, 3]
+    return LandmarkList.from_array(values)
 
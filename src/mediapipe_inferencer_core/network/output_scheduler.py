@@ -0,0 +1,102 @@
+import threading
+import time
+from typing import Callable
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList, SEGMENT_SIZES, get_segment, set_segment
+
+
+class OutputScheduler:
+    """Emit results at a fixed rate from a timer thread, independent of the inference rate.
+
+    The scheduler keeps the last two pushed results and, on every tick, sends the frame at
+    `clock() - delay`, interpolated between them or extrapolated past the latest one by at most
+    `max_extrapolation` seconds.
+    """
+    # Pushed frames whose landmarks may still be read: the two kept ones, plus the pair a tick
+    # that is still being sent read before the last pushes.
+    FRAMES_IN_USE = 4
+
+    def __init__(self, send: Callable[[HolisticResults], object], rate_hz: float, delay: float = 0.0,
+                 max_extrapolation: float = 0.05, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            send (Callable): Called with every emitted frame, from the timer thread.
+            rate_hz (float): Output rate.
+            delay (float): Time [s] the output lags behind `clock`. About one inference interval
+                lets most frames be interpolated instead of extrapolated.
+            clock (Callable): Clock of the `time` of pushed results (the monotonic capture clock of `DetectorHandler`).
+        """
+        self._send = send
+        self._interval = 1 / rate_hz
+        self._delay = delay
+        self._max_extrapolation = max_extrapolation
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._previous = None
+        self._latest = None
+        self._running = False
+        self._thread = None
+
+    def push(self, results: HolisticResults) -> None:
+        """Hand a new filtered frame over to the scheduler."""
+        if results is None:
+            return
+        with self._lock:
+            if self._latest is not None and results.time <= self._latest.time:
+                self._latest = results
+                return
+            self._previous, self._latest = self._latest, results
+
+    def frame_at(self, time_s: float) -> HolisticResults:
+        """Interpolate (or extrapolate) the pushed frames at `time_s`. Returns None before the first push."""
+        with self._lock:
+            previous, latest = self._previous, self._latest
+        if latest is None:
+            return None
+        if previous is None:
+            return latest
+        span = latest.time - previous.time
+        amount = min((time_s - previous.time) / span, 1 + self._max_extrapolation / span)
+        amount = max(amount, 0)
+        frame = HolisticResults(None, None, None, previous.time + amount * span)
+        for name in SEGMENT_SIZES:
+            set_segment(frame, name, OutputScheduler._interpolate(get_segment(previous, name), get_segment(latest, name), amount))
+        frame.face.blendshapes = OutputScheduler._interpolate_array(previous.face.blendshapes, latest.face.blendshapes, amount)
+        return frame
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _worker(self) -> None:
+        """Timer thread that sends one frame per interval."""
+        deadline = time.perf_counter()
+        while self._running:
+            frame = self.frame_at(self._clock() - self._delay)
+            if frame is not None:
+                self._send(frame)
+            deadline += self._interval
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif remaining < -self._interval:
+                # fell behind (e.g. a slow send); skip the missed ticks instead of bursting
+                deadline = time.perf_counter()
+
+    def _interpolate(previous: LandmarkList, latest: LandmarkList, amount: float) -> LandmarkList:
+        if latest is None or previous is None:
+            return latest
+        values = OutputScheduler._interpolate_array(previous.values, latest.values, amount)
+        return LandmarkList.from_array(values) if values is not latest.values else latest
+
+    def _interpolate_array(previous: np.ndarray, latest: np.ndarray, amount: float) -> np.ndarray:
+        if latest is None or previous is None or np.shape(previous) != np.shape(latest):
+            return latest
+        return previous + amount * (np.asarray(latest) - previous)
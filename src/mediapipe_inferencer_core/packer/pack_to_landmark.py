@@ -1,29 +1,66 @@
 from mediapipe_inferencer_core.data_class import Landmark, LandmarkList
+from itertools import chain
+from types import SimpleNamespace
 import math
+import operator
 import numpy as np
 
+_position_and_visibility = operator.attrgetter('x', 'y', 'z', 'visibility')
+_position = operator.attrgetter('x', 'y', 'z')
+
 def format_landmark(raw_landmark) -> Landmark:
     return Landmark(raw_landmark.x, raw_landmark.y, raw_landmark.z, raw_landmark.visibility)
 
 def format_landmark_with_confidence(position, confidence) -> Landmark:
     return Landmark(position.x, position.y, position.z, confidence)
 
-def pack_landmarks(raw_landmarks) -> LandmarkList:
+def landmarks_to_array(raw_landmarks, out:np.ndarray=None) -> np.ndarray:
+    """Pack MediaPipe landmarks into an (N, 4) float32 array of [x, y, z, visibility] rows
+    without building intermediate `Landmark` objects. Landmarks already packed into an (N, 4) array
+    (e.g. by a `ProcessDetector` worker) are copied."""
+    if isinstance(raw_landmarks, np.ndarray):
+        if out is None:
+            return raw_landmarks.astype(np.float32)
+        out[:] = raw_landmarks
+        return out
+    count = len(raw_landmarks)
+    values = np.fromiter(chain.from_iterable(map(_position_and_visibility, raw_landmarks)), dtype=np.float32, count=4*count)
+    if out is None:
+        return values.reshape(count, 4)
+    out.reshape(-1)[:] = values
+    return out
+
+def landmarks_to_array_with_confidence(raw_landmarks, confidence:float, out:np.ndarray=None) -> np.ndarray:
+    """Same as `landmarks_to_array`, with one confidence for every landmark."""
+    count = len(raw_landmarks)
+    if out is None:
+        out = np.empty((count, 4), dtype=np.float32)
+    if isinstance(raw_landmarks, np.ndarray):
+        out[:, 0:3] = raw_landmarks[:, 0:3]
+        out[:, 3] = confidence
+        return out
+    out[:, 0:3] = np.fromiter(chain.from_iterable(map(_position, raw_landmarks)), dtype=np.float32, count=3*count).reshape(count, 3)
+    out[:, 3] = confidence
+    return out
+
+def pack_landmarks(raw_landmarks, out:np.ndarray=None) -> LandmarkList:
     if raw_landmarks is None:
         return LandmarkList([])
-    return LandmarkList([format_landmark(lm) for lm in raw_landmarks])
+    return LandmarkList.from_array(landmarks_to_array(raw_landmarks, out))
 
 def pack_blendshapes(blendshapes) -> np.ndarray:
     if blendshapes is None:
         return np.array([])
+    if isinstance(blendshapes, np.ndarray):
+        return blendshapes.astype(float)
     return np.array([bl.score for bl in blendshapes])
 
-def pack_hand_landmarks(raw_landmarks) -> LandmarkList:
+def pack_hand_landmarks(raw_landmarks, local_out:np.ndarray=None, world_out:np.ndarray=None) -> LandmarkList:
     if raw_landmarks is None:
         return LandmarkList([])
     confidence = raw_landmarks['confidence']
-    local = LandmarkList([format_landmark_with_confidence(lm, confidence) for lm in raw_landmarks['local_landmark']])
-    world = LandmarkList([format_landmark_with_confidence(lm, confidence) for lm in raw_landmarks['world_landmark']])
+    local = LandmarkList.from_array(landmarks_to_array_with_confidence(raw_landmarks['local_landmark'], confidence, local_out))
+    world = LandmarkList.from_array(landmarks_to_array_with_confidence(raw_landmarks['world_landmark'], confidence, world_out))
     return local, world
 
 def extract_hand_landmarks(hand_results, pose_results):
@@ -64,7 +101,26 @@ def extract_hand_landmarks(hand_results, pose_results):
     return [get_best_hand('Left'), get_best_hand('Right')]
 
 def l2(p1, p2):
-    """Calculate L2 distance (Euclidean distance) between two points."""
-    return math.dist((p1.x, p1.y), (p2.x, p2.y))
-
-MAX_DISTANCE = 0.1
\ No newline at end of file
+    """Calculate L2 distance (Euclidean distance) between two points (landmarks or packed [x, y, ...] rows)."""
+    return math.dist(_xy(p1), _xy(p2))
+
+def _xy(point):
+    return (point[0], point[1]) if isinstance(point, np.ndarray) else (point.x, point.y)
+
+MAX_DISTANCE = 0.1
+
+def pack_raw_results(raw_results):
+    """Picklable copy of a pose, hand or face landmarker result with the landmark lists packed into arrays."""
+    if hasattr(raw_results, 'pose_landmarks'):
+        return SimpleNamespace(
+            pose_landmarks=[landmarks_to_array(landmarks) for landmarks in raw_results.pose_landmarks],
+            pose_world_landmarks=[landmarks_to_array(landmarks) for landmarks in raw_results.pose_world_landmarks])
+    if hasattr(raw_results, 'hand_landmarks'):
+        return SimpleNamespace(
+            hand_landmarks=[landmarks_to_array_with_confidence(landmarks, 0.0) for landmarks in raw_results.hand_landmarks],
+            hand_world_landmarks=[landmarks_to_array_with_confidence(landmarks, 0.0) for landmarks in raw_results.hand_world_landmarks],
+            handedness=[[SimpleNamespace(category_name=category.category_name, score=category.score) for category in categories]
+                        for categories in raw_results.handedness])
+    return SimpleNamespace(
+        face_landmarks=[landmarks_to_array(landmarks) for landmarks in raw_results.face_landmarks],
+        face_blendshapes=[np.array([category.score for category in categories]) for categories in raw_results.face_blendshapes])
\ No newline at end of file
@@ -30,10 +30,10 @@ def pack_landmarks(pose_landmarks:LandmarkList)->list:
         return []
     return [format_landmark(mp_lm) for mp_lm in pose_landmarks.values]
 
-def pack_blendshapes(blendshapes: list[float])->list:
+def pack_blendshapes(blendshapes: np.ndarray)->list:
     if blendshapes is None:
         return []
-    return [ bl for bl in blendshapes]
+    return np.asarray(blendshapes, dtype=float).tolist()
 
 def format_landmark(landmark:np.ndarray):
     packed_landmark = landmark_pb2.LandmarkPoint()
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+
+def letterbox_region(frame_size: tuple[int, int], size: tuple[int, int]) -> tuple[tuple[int, int, int, int], tuple[float, float, float, float]]:
+    """Where a frame goes when it is letterboxed to `size`, keeping its aspect ratio.
+
+    Args:
+        frame_size (tuple): (width, height) [px] of the frame.
+        size (tuple): (width, height) [px] of the letterboxed image.
+    Returns:
+        tuple: The (x, y, width, height) [px] of the frame content in the letterboxed image, and the region
+            (x, y, width, height) [px] of the frame the letterboxed image covers, for `remap_results`.
+    """
+    width, height = frame_size
+    target_width, target_height = size
+    scale = min(target_width / width, target_height / height)
+    content_width, content_height = max(round(width * scale), 1), max(round(height * scale), 1)
+    x, y = (target_width - content_width) // 2, (target_height - content_height) // 2
+    # The rounded content size is used for both axes, so the remapping is exact.
+    scale_x, scale_y = content_width / width, content_height / height
+    return (x, y, content_width, content_height), (-x / scale_x, -y / scale_y, target_width / scale_x, target_height / scale_y)
+
+
+def remap_results(results, region: tuple[float, float, float, float], frame_size: tuple[int, int]):
+    """Remap the image landmarks of packed pose, hand or face results from a crop to normalized coordinates of the frame.
+
+    Args:
+        results: Results packed by `pack_raw_results`, remapped in place.
+        region (tuple): Crop (x, y, width, height) [px] the results were detected in. It may extend past
+            the frame, e.g. for a letterboxed image.
+        frame_size (tuple): (width, height) [px] of the frame.
+    """
+    x, y, crop_width, crop_height = region
+    width, height = frame_size
+    for name in ('pose_landmarks', 'hand_landmarks', 'face_landmarks'):
+        for landmarks in getattr(results, name, []):
+            landmarks[:, 0] = (x + landmarks[:, 0] * crop_width) / width
+            landmarks[:, 1] = (y + landmarks[:, 1] * crop_height) / height
+            # Image landmark depth is on the scale of x.
+            landmarks[:, 2] *= crop_width / width
+    return results
+
+
+def remap_tiled_results(results, regions: list[tuple[float, float, float, float]], frame_size: tuple[int, int]):
+    """Remap packed results detected in an image of crops placed side by side, in the order of `regions`.
+
+    Each landmark list is remapped from the tile its mean x falls in, so a tile should hold a single subject.
+
+    Args:
+        results: Results packed by `pack_raw_results`, remapped in place.
+        regions (list): Crops (x, y, width, height) [px] of the frame, each resized to the same tile size.
+        frame_size (tuple): (width, height) [px] of the frame.
+    """
+    n_tiles = len(regions)
+    for name in ('pose_landmarks', 'hand_landmarks', 'face_landmarks'):
+        for landmarks in getattr(results, name, []):
+            tile = min(max(int(landmarks[:, 0].mean() * n_tiles), 0), n_tiles - 1)
+            x, y, crop_width, crop_height = regions[tile]
+            # The tiled image spans `n_tiles` crops, starting `tile` crops left of this one.
+            tiled_region = (x - tile * crop_width, y, n_tiles * crop_width, crop_height)
+            remap_results(SimpleNamespace(**{name: [landmarks]}), tiled_region, frame_size)
+    return results
@@ -0,0 +1,49 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+
+class SharedFrameRing:
+    """Fixed-shape uint8 image slots in shared memory, to hand frames to another process without pickling them.
+
+    The owner creates the ring and writes frames into free slots; other processes attach to it by `name`
+    and read the slots they are told about. Which slots are free is up to the owner.
+    """
+
+    def __init__(self, shape: tuple, slots: int, name: str = None):
+        """
+        Args:
+            shape (tuple): Shape of a frame, e.g. (height, width, 3).
+            slots (int): Number of frames in the ring.
+            name (str): Name of an existing ring to attach to. A new ring is created by default.
+        """
+        self._shape = tuple(shape)
+        size = slots * int(np.prod(self._shape))
+        self._owner = name is None
+        self._memory = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        self._frames = np.ndarray((slots, *self._shape), dtype=np.uint8, buffer=self._memory.buf)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def shape(self) -> tuple:
+        return self._shape
+
+    @property
+    def slots(self) -> int:
+        return len(self._frames)
+
+    def write(self, slot: int, image: np.ndarray) -> None:
+        self._frames[slot] = image
+
+    def frame(self, slot: int) -> np.ndarray:
+        """View of the frame in `slot`. It changes when the owner writes the slot again."""
+        return self._frames[slot]
+
+    def close(self) -> None:
+        """Detach from the ring, and free it if this process created it."""
+        self._frames = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
@@ -8,6 +8,7 @@ class MmapSettings:
     enable_visualization_window: bool
     enable_pose_inference: bool
     enable_3d_visualization: bool
+    record_landmarks_path: str
 
 
 def create_settings_from_args() -> MmapSettings:
@@ -17,6 +18,7 @@ def create_settings_from_args() -> MmapSettings:
     parser.add_argument('--enable_pose_inference', action='store_true')
     parser.add_argument('--enable_visualization_window', action='store_true')
     parser.add_argument('--enable_3d_visualization', action='store_true')
+    parser.add_argument('--record_landmarks_path', default="")
 
     args = parser.parse_args()
 
@@ -24,5 +26,6 @@ def create_settings_from_args() -> MmapSettings:
         mmap_file_path=args.mmap_file_path,
         enable_visualization_window=args.enable_visualization_window,
         enable_pose_inference=args.enable_pose_inference,
-        enable_3d_visualization=args.enable_3d_visualization
+        enable_3d_visualization=args.enable_3d_visualization,
+        record_landmarks_path=args.record_landmarks_path
     )
@@ -0,0 +1,57 @@
+import argparse
+from dataclasses import dataclass
+from mediapipe_inferencer_core.filter.filter_bank import FILTER_PARAMETERS
+
+
+@dataclass
+class SweepSettings:
+    recordings: list[str]
+    algorithm: str
+    grids: dict[str, list[float]]
+    groups: list[str]
+    reference_sigma: float
+    lag_weight: float
+    workers: int
+    settings_path: str
+    write_settings: bool
+
+
+def parse_grid(text: str) -> tuple[str, list[float]]:
+    name, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2,... but got '{text}'")
+    return name, [float(value) for value in values.split(',')]
+
+
+def create_settings_from_args() -> SweepSettings:
+    parser = argparse.ArgumentParser(description="Sweep filter parameters over recorded landmark files.")
+
+    parser.add_argument('recordings', nargs='+', help="Files written with --record_landmarks_path")
+    parser.add_argument('--algorithm', choices=['one_euro', 'kalman'], default='one_euro')
+    parser.add_argument('--grid', type=parse_grid, action='append', default=[],
+                        help="Candidate values of one parameter, e.g. --grid min_cutoff=0.05,0.1,0.5")
+    parser.add_argument('--groups', nargs='+', choices=['pose', 'hand', 'face'], default=['pose', 'hand', 'face'])
+    parser.add_argument('--reference_sigma', type=float, default=2.0,
+                        help="Sigma [frames] of the zero-phase smoothing used as the lag reference")
+    parser.add_argument('--lag_weight', type=float, default=1.0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--settings_path', default="settings.json")
+    parser.add_argument('--write_settings', action='store_true')
+
+    args = parser.parse_args()
+    unknown = [name for name, _ in args.grid if name not in FILTER_PARAMETERS[args.algorithm]]
+    if unknown:
+        parser.error(f"unknown {args.algorithm} parameters in --grid: {', '.join(unknown)} "
+                     f"(expected {', '.join(FILTER_PARAMETERS[args.algorithm])})")
+
+    return SweepSettings(
+        recordings=args.recordings,
+        algorithm=args.algorithm,
+        grids=dict(args.grid),
+        groups=args.groups,
+        reference_sigma=args.reference_sigma,
+        lag_weight=args.lag_weight,
+        workers=args.workers,
+        settings_path=args.settings_path,
+        write_settings=args.write_settings
+    )
@@ -8,6 +8,7 @@ class WebcamSettings:
     grpc_port: int
     preview_mmap_path: str
     preview_mmap_alpha: bool
+    record_landmarks_path: str
 
 
 def create_settings_from_args() -> WebcamSettings:
@@ -17,6 +18,7 @@ def create_settings_from_args() -> WebcamSettings:
     parser.add_argument('--grpc_port', type=int, default=50051)
     parser.add_argument('--preview_mmap_path', default="")
     parser.add_argument('--preview_mmap_alpha', action='store_true')
+    parser.add_argument('--record_landmarks_path', default="")
 
     args = parser.parse_args()
 
@@ -24,5 +26,6 @@ def create_settings_from_args() -> WebcamSettings:
         enable_visualization_window=args.enable_visualization_window,
         grpc_port=args.grpc_port,
         preview_mmap_path=args.preview_mmap_path,
-        preview_mmap_alpha=args.preview_mmap_alpha
+        preview_mmap_alpha=args.preview_mmap_alpha,
+        record_landmarks_path=args.record_landmarks_path
     )
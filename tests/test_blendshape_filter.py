@@ -0,0 +1,19 @@
+import numpy as np
+from mediapipe_inferencer_core.filter import BlendshapeFilter
+
+def test_smooths_scores():
+    blendshape_filter = BlendshapeFilter(0.5)
+    np.testing.assert_allclose(blendshape_filter.filter(np.zeros(52)), 0)
+    np.testing.assert_allclose(blendshape_filter.filter(np.ones(52)), 0.5)
+    np.testing.assert_allclose(blendshape_filter.filter(np.ones(52)), 0.75)
+
+def test_dead_band_suppresses_small_changes():
+    blendshape_filter = BlendshapeFilter(1.0, dead_band=0.05)
+    scores = np.full(52, 0.2)
+    assert blendshape_filter.filter(scores) is not None
+    scores[3] += 0.04
+    assert blendshape_filter.filter(scores) is None
+    # changes accumulate against the last emitted scores, not the last input
+    scores[3] += 0.02
+    np.testing.assert_allclose(blendshape_filter.filter(scores), scores)
+    assert blendshape_filter.filter(None) is None
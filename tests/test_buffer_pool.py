@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkBufferPool
+from mediapipe_inferencer_core.filter import FilterBank
+
+def fake_landmarks(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in rng.random((n, 4)).tolist()]
+
+def make_raw_pose(seed):
+    return SimpleNamespace(pose_landmarks=[fake_landmarks(33, seed)], pose_world_landmarks=[fake_landmarks(33, seed + 1)])
+
+def test_released_buffers_are_reused():
+    pool = LandmarkBufferPool(capacity=1)
+    results = HolisticResults(make_raw_pose(0), None, None, 1.0, pool)
+    assert pool.in_use == 2
+    packed = results.pose.world.values
+    np.testing.assert_allclose(packed[:, 0], [lm.x for lm in make_raw_pose(0).pose_world_landmarks[0]], rtol=1e-6)
+    pool.release_results(results, results.snapshot())
+    assert pool.in_use == 0
+    reused = HolisticResults(make_raw_pose(2), None, None, 2.0, pool)
+    assert reused.pose.world.values is packed or reused.pose.local.values is packed
+
+def test_steady_state_loop_does_not_grow_the_pool():
+    pool = LandmarkBufferPool(capacity=2)
+    bank = FilterBank({'pose_local': (1.0, 1.0, 1.0), 'pose_world': (1.0, 1.0, 1.0)}, pool=pool)
+    buffers = set()
+    for i in range(10):
+        raw = HolisticResults(make_raw_pose(i), None, None, 1 + i / 30, pool)
+        filtered = bank.filter(raw.snapshot())
+        buffers.update(id(landmarks.values) for landmarks in (filtered.pose.local, filtered.pose.world))
+        pool.release_results(raw, filtered)
+        assert pool.in_use == 0
+    assert len(buffers) <= 4
+
+def test_debug_mode_poisons_released_buffers():
+    pool = LandmarkBufferPool(debug=True)
+    values = pool.acquire('left_hand_local')
+    values[:] = 1
+    pool.release(values)
+    assert np.isnan(values).all()
+    with pytest.raises(ValueError):
+        values[0, 0] = 0
+    pool.release(np.zeros((21, 4)))
+    assert pool.in_use == 0
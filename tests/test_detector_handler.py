@@ -0,0 +1,205 @@
+from types import SimpleNamespace
+import threading
+import numpy as np
+import pytest
+
+pytest.importorskip('mediapipe')
+from mediapipe_inferencer_core.data_class import LandmarkBufferPool
+from mediapipe_inferencer_core.detector import DetectorHandler, LandmarkDetector
+from mediapipe_inferencer_core.input_resizer import InputResizer
+from mediapipe_inferencer_core.motion_gate import MotionGate
+
+def fake_landmarks(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in rng.random((n, 4)).tolist()]
+
+class FakeDetector(LandmarkDetector):
+    def inference(self, image, frame_timestamp_ms):
+        pass
+    def callback(self, raw, timestamp_ms):
+        self._save_results(raw, None, timestamp_ms)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def make_raw_face(seed):
+    return SimpleNamespace(face_landmarks=[fake_landmarks(478, seed)], face_blendshapes=[])
+
+def make_raw_pose(seed):
+    return SimpleNamespace(pose_landmarks=[fake_landmarks(33, seed)], pose_world_landmarks=[fake_landmarks(33, seed + 1)])
+
+IMAGE = np.zeros((4, 4, 3), dtype=np.uint8)
+
+def submit(handler, clock, time_s):
+    clock.now = time_s
+    handler.inference(IMAGE)
+
+def test_only_updated_parts_are_repacked():
+    pose, face = FakeDetector(), FakeDetector()
+    pool = LandmarkBufferPool()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, pool=pool, clock=clock)
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    face.callback(make_raw_face(1), 1000)
+    first = handler.results
+
+    # The face detector dropped frame 1033: its latest earlier result is used once the wait budget is over.
+    submit(handler, clock, 1.033)
+    pose.callback(make_raw_pose(2), 1033)
+    assert handler.fresh_parts == set()
+    clock.now = 1.1
+    assert handler.fresh_parts == {'pose'}
+    second = handler.results
+    assert second.time == 1.033
+    assert handler.fresh_parts == set()
+    assert second.face.landmarks is first.face.landmarks
+    assert second.pose.world is not first.pose.world
+    np.testing.assert_allclose(second.pose.world.values[:, 0], [lm.x for lm in make_raw_pose(2).pose_world_landmarks[0]], rtol=1e-6)
+    # The replaced pose buffers went back to the pool.
+    assert pool.in_use == 3
+
+def test_pairs_results_of_the_same_frame():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, wait_budget=0.03, clock=clock)
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    face.callback(make_raw_face(1), 1000)
+    submit(handler, clock, 1.033)
+    pose.callback(make_raw_pose(2), 1033)
+    clock.now = 1.05
+    # Frame 1033 still waits for its face result, so the complete frame 1000 is delivered.
+    results = handler.results
+    assert results.time == 1.0
+    np.testing.assert_allclose(results.pose.local.values[:, 0], [lm.x for lm in make_raw_pose(0).pose_landmarks[0]], rtol=1e-6)
+    face.callback(make_raw_face(3), 1033)
+    assert handler.results.time == 1.033
+
+def test_wait_for_results_wakes_up_on_the_completing_callback():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, clock=clock)
+    published = []
+    handler.subscribe(lambda results: published.append(results.time))
+    assert handler.wait_for_results(timeout=0.01) is None
+
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    threading.Timer(0.05, face.callback, (make_raw_face(1), 1000)).start()
+    results = handler.wait_for_results(timeout=5)
+    assert results.time == 1.0 and results.face.landmarks is not None
+    assert published == [1.0]
+    assert handler.wait_for_results(timeout=0.01) is None
+
+def test_busy_detectors_are_skipped_and_counted():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, clock=clock, request_timeout=0.5)
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    submit(handler, clock, 1.033)
+    assert face.pending == [1000] and pose.pending == [1033]
+    face.callback(make_raw_face(1), 1000)
+    # Frame 1033 was not submitted to the busy face detector, so it does not wait for it.
+    pose.callback(make_raw_pose(2), 1033)
+    results = handler.wait_for_results(timeout=0)
+    assert results.time == 1.033 and results.face.landmarks is not None
+
+    submit(handler, clock, 1.066)
+    submit(handler, clock, 2.0)
+    assert handler.statistics == {
+        'pose': {'submitted': 4, 'completed': 2, 'dropped': 1, 'skipped': 0, 'throttled': 0, 'static': 0},
+        'face': {'submitted': 3, 'completed': 1, 'dropped': 1, 'skipped': 1, 'throttled': 0, 'static': 0},
+    }
+
+def test_detector_rates_reuse_the_latest_result():
+    pose, hand, face = FakeDetector(), FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, hand=hand, face=face, clock=clock, rates={'face': 30}, frame_intervals={'hand': 3})
+    for frame in range(6):
+        submit(handler, clock, 1 + frame / 60)
+        timestamp_ms = handler.latest_time_ms
+        pose.callback(make_raw_pose(frame), timestamp_ms)
+        if timestamp_ms in face.pending:
+            face.callback(make_raw_face(frame), timestamp_ms)
+        if timestamp_ms in hand.pending:
+            hand.callback(SimpleNamespace(hand_landmarks=[], hand_world_landmarks=[], handedness=[]), timestamp_ms)
+    statistics = handler.statistics
+    assert statistics['pose']['submitted'] == 6
+    assert statistics['face']['submitted'] == 3 and statistics['face']['throttled'] == 3
+    assert statistics['hand']['submitted'] == 2 and statistics['hand']['throttled'] == 4
+    # The last frame was not submitted to the face detector, which reuses the result of the frame before.
+    results = handler.results
+    assert results.time == 1.083
+    assert results.part_times == {'pose': 1.083, 'hand': 1.05, 'face': 1.066}
+
+def test_frame_intervals_count_the_frames_offered_by_the_loop():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, clock=clock, frame_intervals={'pose': 2, 'face': 2})
+    for frame in range(6):
+        clock.now = 1 + frame / 60
+        # As the entry scripts do: frames are only prepared and passed on while a detector can take them.
+        if handler.accepts_frame:
+            handler.inference(IMAGE)
+        for detector, raw in ((pose, make_raw_pose(frame)), (face, make_raw_face(frame))):
+            if detector is face and frame < 2:
+                # The face detector is still busy with frame 0 when it is due again, so it takes frame 3.
+                continue
+            for timestamp_ms in list(detector.pending):
+                detector.callback(raw, timestamp_ms)
+    statistics = handler.statistics
+    assert statistics['pose']['submitted'] == 3 and statistics['pose']['throttled'] == 3
+    assert statistics['face']['submitted'] == 3 and statistics['face']['throttled'] == 2
+    assert statistics['face']['skipped'] == 1
+
+def test_partial_updates_publish_each_part_on_arrival():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, clock=clock, partial_updates=True)
+    parts = []
+    handler.subscribe(lambda results: parts.append((results.time, results.pose.world is not None, results.face.landmarks is not None)), partial=True)
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    assert parts == [(1.0, True, False)]
+    submit(handler, clock, 1.033)
+    pose.callback(make_raw_pose(2), 1033)
+    face.callback(make_raw_face(1), 1000)
+    assert parts[1:] == [(1.033, True, False), (1.0, False, True)]
+    # The whole frame carries the latest result of every detector.
+    results = handler.results
+    assert results.time == 1.033 and results.face.landmarks is not None
+
+def test_static_frames_reuse_the_latest_result():
+    pose, face = FakeDetector(), FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, face=face, clock=clock, motion_gate=MotionGate(max_skips=1, step=1))
+    submit(handler, clock, 1.0)
+    pose.callback(make_raw_pose(0), 1000)
+    face.callback(make_raw_face(1), 1000)
+    submit(handler, clock, 1.033)
+    assert pose.pending == [] and face.pending == []
+    results = handler.results
+    assert results.time == 1.0 and results.face.landmarks is not None
+
+    # A static detector runs again after max_skips frames.
+    submit(handler, clock, 1.066)
+    assert pose.pending == [1066] and face.pending == [1066]
+    assert handler.statistics['face']['static'] == 1
+
+def test_letterboxed_results_are_mapped_to_the_captured_frame():
+    pose = FakeDetector()
+    clock = FakeClock()
+    handler = DetectorHandler(pose=pose, clock=clock, resizer=InputResizer((8, 8), letterbox=True))
+    clock.now = 1.0
+    handler.inference(np.zeros((4, 8, 3), dtype=np.uint8))
+    raw_pose = make_raw_pose(0)
+    for landmark in raw_pose.pose_landmarks[0]:
+        landmark.y = 0.25 + landmark.y / 2
+    pose.callback(raw_pose, 1000)
+    expected = [(landmark.y - 0.25) * 2 for landmark in raw_pose.pose_landmarks[0]]
+    np.testing.assert_allclose(handler.results.pose.local.values[:, 1], expected, rtol=1e-5)
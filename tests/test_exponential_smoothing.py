@@ -0,0 +1,29 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import Landmark, LandmarkList
+from mediapipe_inferencer_core.filter import ExponentialSmoothing, OneEuroFilter
+
+def test_exponential_smoothing_matches_landmark_lerp():
+    rng = np.random.default_rng(0)
+    frames = rng.random((5, 21, 4))
+    smoothing = ExponentialSmoothing(0.3)
+    expected = frames[0]
+    smoothing.filter(LandmarkList.from_array(frames[0]))
+    for current in frames[1:]:
+        expected = np.array([Landmark.lerp(Landmark(*prev), Landmark(*cur), 0.3).Landmark for prev, cur in zip(expected, current)])
+        actual = smoothing.filter(LandmarkList.from_array(current))
+        np.testing.assert_allclose(actual.values, expected)
+
+def test_filters_chain_on_arrays_with_out_buffer():
+    rng = np.random.default_rng(1)
+    frames = rng.random((5, 33, 4))
+    one_euro = OneEuroFilter(1.0, 1.0, 1.0, vectorized=True)
+    smoothing = ExponentialSmoothing(0.5)
+    reference_one_euro = OneEuroFilter(1.0, 1.0, 1.0, vectorized=True)
+    reference_smoothing = ExponentialSmoothing(0.5)
+    buffer = np.empty((33, 4))
+    for i, current in enumerate(frames):
+        time = 1 + i / 60
+        chained = smoothing.filter(one_euro.filter(current, time, out=buffer), out=buffer)
+        assert chained is buffer
+        expected = reference_smoothing.filter(reference_one_euro.filter(LandmarkList.from_array(current), time))
+        np.testing.assert_allclose(chained, expected.values)
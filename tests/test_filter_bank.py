@@ -0,0 +1,39 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.filter import FilterBank, OneEuroFilter
+
+HAND_PARAMS = (0.08, 6.0, 1.0)
+FACE_PARAMS = (1.0, 1.0, 1.0)
+
+def make_results(rng, time, with_left_hand=True):
+    results = HolisticResults(None, None, None, time)
+    if with_left_hand:
+        results.hand.left.local = LandmarkList.from_array(rng.random((21, 4)))
+    results.face.landmarks = LandmarkList.from_array(rng.random((478, 4)))
+    return results
+
+def test_filter_bank_matches_separate_filters():
+    rng = np.random.default_rng(0)
+    bank = FilterBank({'left_hand_local': HAND_PARAMS, 'face_landmark': FACE_PARAMS})
+    hand_filter = OneEuroFilter(*HAND_PARAMS, vectorized=True)
+    face_filter = OneEuroFilter(*FACE_PARAMS, vectorized=True)
+    for frame in range(20):
+        time = 1 + frame / 30
+        # the left hand drops out for a few frames and must resume from its own state
+        results = make_results(rng, time, with_left_hand=not 5 <= frame < 9)
+        expected_hand = hand_filter.filter(results.hand.left.local, time)
+        expected_face = face_filter.filter(results.face.landmarks, time)
+        bank.filter(results)
+        if expected_hand is None:
+            assert results.hand.left.local is None
+        else:
+            np.testing.assert_allclose(results.hand.left.local.values, expected_hand.values)
+        np.testing.assert_allclose(results.face.landmarks.values, expected_face.values)
+
+def test_filter_bank_passes_through_unlisted_segments():
+    rng = np.random.default_rng(1)
+    bank = FilterBank({'face_landmark': FACE_PARAMS})
+    results = make_results(rng, 1.0)
+    hand = results.hand.left.local
+    bank.filter(results)
+    assert results.hand.left.local is hand
@@ -0,0 +1,36 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.filter import FilterBank, ForwardPredictor
+
+VELOCITY = np.array([0.3, 0.0, -0.1])
+
+def moving_hand(time):
+    results = HolisticResults(None, None, None, time)
+    values = np.ones((21, 4))
+    values[:, 0:3] = 0.5 + VELOCITY * time
+    results.hand.left.local = LandmarkList.from_array(values)
+    return results
+
+def run_bank(algorithm, params, n_frames=60):
+    bank = FilterBank({'left_hand_local': params}, algorithm=algorithm)
+    for frame in range(n_frames):
+        results = bank.filter(moving_hand(frame / 60))
+    return bank, results
+
+def test_predicts_ahead_along_filtered_velocity():
+    for algorithm, params in [('kalman', (1.0, 1e-4)), ('one_euro', (1.0, 1.0, 1.0))]:
+        bank, results = run_bank(algorithm, params)
+        predictor = ForwardPredictor(bank, {'left_hand_local': (0.05, 1.0)})
+        filtered = results.hand.left.local.values.copy()
+        predictor.predict(results, send_time=results.time + 0.02)
+        np.testing.assert_allclose(results.hand.left.local.values[:, 0:3] - filtered[:, 0:3],
+                                   bank.velocity[:21] * 0.07)
+        np.testing.assert_allclose(bank.velocity[:21], np.broadcast_to(VELOCITY, (21, 3)), atol=0.05)
+
+def test_clamps_displacement():
+    bank, results = run_bank('kalman', (1.0, 1e-4))
+    predictor = ForwardPredictor(bank, {'left_hand_local': (1.0, 0.01)}, compensate_latency=False)
+    filtered = results.hand.left.local.values.copy()
+    predictor.predict(results, send_time=results.time)
+    distance = np.linalg.norm(results.hand.left.local.values[:, 0:3] - filtered[:, 0:3], axis=1)
+    np.testing.assert_allclose(distance, 0.01)
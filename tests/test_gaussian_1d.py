@@ -0,0 +1,15 @@
+import numpy as np
+from scipy.ndimage import gaussian_filter1d
+from mediapipe_inferencer_core.data_class import LandmarkList
+from mediapipe_inferencer_core.filter import Gaussian1dFilter
+
+def test_gaussian_matches_center_of_scipy_filter():
+    sigma, window_size = 1.5, 7
+    rng = np.random.default_rng(0)
+    frames = rng.random((15, 33, 4))
+    gaussian = Gaussian1dFilter(sigma, window_size, 33)
+    for i in range(len(frames)):
+        history = frames[max(0, i + 1 - window_size):i + 1]
+        expected = gaussian_filter1d(history, sigma, axis=0)[len(history) // 2]
+        actual = gaussian.filter(LandmarkList.from_array(frames[i]))
+        np.testing.assert_allclose(actual.values, expected)
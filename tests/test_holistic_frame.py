@@ -0,0 +1,36 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticFrame, HolisticResults, LandmarkList
+from mediapipe_inferencer_core.filter import FilterBank
+
+def make_results(time):
+    rng = np.random.default_rng(0)
+    results = HolisticResults(None, None, None, time)
+    results.pose.world = LandmarkList.from_array(rng.random((33, 4)))
+    results.hand.right.local = LandmarkList.from_array(rng.random((21, 4)))
+    results.face.blendshapes = rng.random(52)
+    return results
+
+def test_round_trip_through_one_buffer():
+    results = make_results(12345.678901)
+    frame = HolisticFrame.from_results(results)
+    assert frame.time == 12345.678901
+    assert frame.is_present('pose_world') and not frame.is_present('pose_local')
+    np.testing.assert_allclose(frame.right_hand_local, results.hand.right.local.values, rtol=1e-6)
+    copied = HolisticFrame(frame.buffer.copy())
+    restored = copied.to_results()
+    assert restored.pose.local is None and restored.face.landmarks is None
+    np.testing.assert_allclose(restored.pose.world.values, results.pose.world.values, rtol=1e-6)
+    np.testing.assert_allclose(restored.face.blendshapes, results.face.blendshapes, rtol=1e-6)
+    assert np.shares_memory(restored.pose.world.values, copied.buffer)
+
+def test_filter_bank_filters_frame_in_place():
+    params = {'pose_world': (1.0, 1.0, 1.0), 'right_hand_local': (1.0, 1.0, 1.0)}
+    bank_for_results, bank_for_frame = FilterBank(params), FilterBank(params)
+    frame = HolisticFrame()
+    for i in range(3):
+        results = make_results(1 + i / 30)
+        results.pose.world.values[:] += i * 0.1
+        HolisticFrame.from_results(results, frame)
+        bank_for_frame.filter_frame(frame)
+        bank_for_results.filter(results)
+        np.testing.assert_allclose(frame.pose_world, results.pose.world.values, rtol=1e-6)
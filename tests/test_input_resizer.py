@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('cv2')
+from mediapipe_inferencer_core.input_resizer import InputResizer
+
+IMAGE = np.full((720, 1280, 3), 255, dtype=np.uint8)
+
+def test_stretched_frames_keep_normalized_coordinates():
+    resized, region = InputResizer((640, 480)).resize(IMAGE)
+    assert resized.shape == (480, 640, 3) and region is None
+    assert InputResizer((1280, 720), letterbox=True).resize(IMAGE) == (IMAGE, None)
+
+def test_letterboxed_frames_are_padded():
+    resized, region = InputResizer((640, 640), letterbox=True).resize(IMAGE)
+    assert resized.shape == (640, 640, 3)
+    assert resized[:140].max() == 0 and resized[500:].max() == 0 and resized[140:500].min() == 255
+    assert region == (0.0, -280.0, 1280.0, 1280.0)
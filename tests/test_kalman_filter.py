@@ -0,0 +1,35 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.filter import FilterBank, KalmanFilter
+
+def test_kalman_tracks_constant_velocity():
+    velocity = np.array([0.3, -0.2, 0.1])
+    rng = np.random.default_rng(0)
+    kalman = KalmanFilter(1.0, 1e-4)
+    for frame in range(120):
+        time = frame / 60
+        values = np.ones((21, 4))
+        values[:, 0:3] = 0.5 + velocity * time + rng.normal(0, 0.002, (21, 3))
+        kalman.filter(values, time)
+    np.testing.assert_allclose(kalman.velocity, np.broadcast_to(velocity, (21, 3)), atol=0.05)
+    predicted = kalman.predict(0.1)
+    np.testing.assert_allclose(predicted[:, 0:3] - kalman.result.values[:, 0:3], kalman.velocity * 0.1)
+
+def test_kalman_reduces_jitter():
+    rng = np.random.default_rng(1)
+    noisy = np.full((200, 478, 4), 0.5)
+    noisy[:, :, 0:3] += rng.normal(0, 0.003, (200, 478, 3))
+    kalman = KalmanFilter(1.0, 1e-4)
+    filtered = np.array([kalman.filter(values, frame / 60) for frame, values in enumerate(noisy)])
+    assert filtered[50:, :, 0:3].std() < 0.7 * noisy[50:, :, 0:3].std()
+
+def test_filter_bank_runs_kalman():
+    rng = np.random.default_rng(2)
+    bank = FilterBank({'face_landmark': (1.0, 1e-4)}, algorithm='kalman')
+    kalman = KalmanFilter(1.0, 1e-4)
+    for frame in range(10):
+        results = HolisticResults(None, None, None, 1 + frame / 30)
+        results.face.landmarks = LandmarkList.from_array(rng.random((478, 4)))
+        expected = kalman.filter(results.face.landmarks, results.time)
+        bank.filter(results)
+        np.testing.assert_allclose(results.face.landmarks.values, expected.values)
@@ -1,4 +1,6 @@
+import numpy as np
 from mediapipe_inferencer_core.data_class.landmark import Landmark
+from mediapipe_inferencer_core.data_class.landmark_list import LandmarkList
 from mediapipe_inferencer_core.util import float_util
 
 def test_value_equal():
@@ -23,3 +25,16 @@ def test_ladmark_lerp():
     assert value_equal(lerp(landmark_1, landmark_2, 0.3), Landmark(x, y, z, confidence))
     assert value_equal(lerp(landmark_1, landmark_2, 1), landmark_2)
     assert value_equal(lerp(landmark_1, landmark_2, 2), landmark_2)
+
+def test_landmark_list_value_is_view():
+    landmark_list = LandmarkList([Landmark(0, 1, 2, 3), Landmark(4, 5, 6, 7)])
+    landmark = landmark_list.value(1)
+    assert Landmark.value_equal(landmark, Landmark(4, 5, 6, 7))
+    assert np.shares_memory(landmark.Landmark, landmark_list.values)
+    landmark_list.values[1, 0] = 8
+    assert landmark.x == 8
+
+def test_landmark_list_float32_storage():
+    landmark_list = LandmarkList([Landmark(0.1, 1, 2, 3)], dtype=np.float32)
+    assert landmark_list.values.dtype == np.float32
+    assert LandmarkList.from_array(np.zeros((2, 4)), dtype=np.float32).values.dtype == np.float32
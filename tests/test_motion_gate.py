@@ -0,0 +1,35 @@
+import numpy as np
+from mediapipe_inferencer_core.motion_gate import MotionGate, landmark_region
+
+def make_image(value=0):
+    return np.full((72, 128, 3), value, dtype=np.uint8)
+
+def test_static_frames_are_skipped_up_to_max_skips():
+    gate = MotionGate(threshold=3.0, max_skips=2, step=8)
+    frame = gate.downscale(make_image())
+    assert frame.shape == (9, 16)
+    assert not gate.is_static('pose', frame)
+    gate.mark_submitted('pose', frame)
+    assert gate.is_static('pose', gate.downscale(make_image(2)))
+    assert gate.is_static('pose', gate.downscale(make_image(2)))
+    assert not gate.is_static('pose', gate.downscale(make_image(2)))
+    gate.mark_submitted('pose', frame)
+    assert not gate.is_static('pose', gate.downscale(make_image(10)))
+
+def test_only_the_region_of_a_part_is_compared():
+    gate = MotionGate(threshold=3.0, step=8)
+    gate.mark_submitted('hand', gate.downscale(make_image()))
+    image = make_image()
+    image[:, 64:] = 255
+    moved = gate.downscale(image)
+    assert gate.is_static('hand', moved, (0.0, 0.0, 0.4, 1.0))
+    assert not gate.is_static('hand', moved, (0.4, 0.0, 0.6, 1.0))
+    # A region at the edge of the image still covers a pixel.
+    assert not gate.is_static('hand', moved, (1.0, 1.0, 1.0, 1.0))
+    assert not MotionGate(regions=False).is_static('hand', moved, (0.0, 0.0, 0.4, 1.0))
+
+def test_landmark_region_is_padded_and_clipped():
+    left = np.array([[0.1, 0.2, 0.0, 1.0], [0.3, 0.4, 0.0, 1.0]])
+    right = np.array([[0.9, 0.5, 0.0, 1.0]])
+    np.testing.assert_allclose(landmark_region(left, None, right, padding=0.25), (0.0, 0.125, 1.0, 0.575))
+    assert landmark_region(None) is None
@@ -0,0 +1,62 @@
+import numpy as np
+from mediapipe_inferencer_core.data_class import LandmarkList
+from mediapipe_inferencer_core.filter import OneEuroFilter
+
+def random_walk(n_frames, n_landmarks, seed=0):
+    rng = np.random.default_rng(seed)
+    values = np.cumsum(rng.normal(0, 0.01, (n_frames, n_landmarks, 4)), axis=0) + 0.5
+    values[:, :, 3] = rng.uniform(0.5, 1.0, (n_frames, n_landmarks))
+    return values
+
+def test_vectorized_matches_per_landmark():
+    values = random_walk(30, 21)
+    per_landmark = OneEuroFilter(0.08, 6.0, 1.0)
+    vectorized = OneEuroFilter(0.08, 6.0, 1.0, vectorized=True)
+    for frame, current in enumerate(values):
+        time = 1 + frame / 60
+        expected = per_landmark.filter(LandmarkList.from_array(current.copy()), time)
+        actual = vectorized.filter(LandmarkList.from_array(current.copy()), time)
+        np.testing.assert_allclose(actual.values, expected.values, rtol=1e-9, atol=1e-12)
+
+def test_vectorized_skips_duplicated_time():
+    values = random_walk(2, 33)
+    one_euro = OneEuroFilter(1.0, 1.0, 1.0, vectorized=True)
+    one_euro.filter(LandmarkList.from_array(values[0]), 1.0)
+    skipped = LandmarkList.from_array(values[1])
+    assert one_euro.filter(skipped, 1.0) is skipped
+    np.testing.assert_array_equal(one_euro.result.values, values[0])
+
+def test_per_landmark_duplicated_time_writes_out():
+    values = random_walk(2, 21)
+    one_euro = OneEuroFilter(1.0, 1.0, 1.0)
+    one_euro.filter_array(values[0], 1.0)
+    out = np.full((21, 4), np.nan)
+    assert one_euro.filter_array(values[1], 1.0, out=out) is out
+    np.testing.assert_array_equal(out, values[1])
+
+def test_per_landmark_filter_writes_out():
+    values = random_walk(2, 21)
+    expected = OneEuroFilter(1.0, 1.0, 1.0)
+    one_euro = OneEuroFilter(1.0, 1.0, 1.0)
+    out = np.full((21, 4), np.nan)
+    for frame, current in enumerate(values):
+        filtered = one_euro.filter(LandmarkList.from_array(current.copy()), 1 + frame / 60, out=out)
+        np.testing.assert_array_equal(out, expected.filter(LandmarkList.from_array(current.copy()), 1 + frame / 60).values)
+        np.testing.assert_array_equal(filtered.values, out)
+
+def test_filter_sequence_matches_streaming():
+    values = random_walk(50, 478)
+    timestamps = 1 + np.arange(50) / 60
+    timestamps[10] = timestamps[9]
+    streaming = OneEuroFilter(0.08, 1.0, 1.0, vectorized=True)
+    expected = np.array([streaming.filter(current, time) for current, time in zip(values, timestamps)])
+    offline = OneEuroFilter(0.08, 1.0, 1.0, vectorized=True)
+    np.testing.assert_array_equal(offline.filter_sequence(values, timestamps), expected)
+
+def test_per_landmark_filter_sequence_matches_vectorized():
+    values = random_walk(20, 21)
+    timestamps = 1 + np.arange(20) / 60
+    timestamps[5] = timestamps[4]
+    vectorized = OneEuroFilter(0.08, 1.0, 1.0, vectorized=True).filter_sequence(values, timestamps)
+    per_landmark = OneEuroFilter(0.08, 1.0, 1.0).filter_sequence(values, timestamps)
+    np.testing.assert_allclose(per_landmark, vectorized, rtol=1e-9, atol=1e-12)
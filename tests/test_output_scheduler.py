@@ -0,0 +1,34 @@
+import time
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.network.output_scheduler import OutputScheduler
+
+def make_results(time_s, value, with_face=True):
+    results = HolisticResults(None, None, None, time_s)
+    results.pose.world = LandmarkList.from_array(np.full((33, 4), value))
+    if with_face:
+        results.face.blendshapes = np.full(52, value)
+    return results
+
+def test_interpolates_and_limits_extrapolation():
+    scheduler = OutputScheduler(lambda frame: None, rate_hz=90, max_extrapolation=0.05)
+    assert scheduler.frame_at(1.0) is None
+    scheduler.push(make_results(1.0, 0.0))
+    scheduler.push(make_results(1.1, 1.0, with_face=False))
+    middle = scheduler.frame_at(1.025)
+    np.testing.assert_allclose(middle.pose.world.values, 0.25)
+    assert middle.time == 1.025
+    assert middle.face.blendshapes is None
+    extrapolated = scheduler.frame_at(2.0)
+    np.testing.assert_allclose(extrapolated.pose.world.values, 1.5)
+
+def test_sends_at_fixed_rate():
+    sent = []
+    scheduler = OutputScheduler(sent.append, rate_hz=200, clock=lambda: 1.05)
+    scheduler.push(make_results(1.0, 0.0))
+    scheduler.push(make_results(1.1, 1.0))
+    scheduler.start()
+    time.sleep(0.2)
+    scheduler.stop()
+    assert 10 < len(sent) < 60
+    np.testing.assert_allclose(sent[-1].pose.world.values, 0.5)
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+import numpy as np
+from mediapipe_inferencer_core.packer import pack_to_landmark
+
+def fake_landmarks(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in rng.random((n, 4)).tolist()]
+
+def test_pack_landmarks_into_float32_buffer():
+    raw_landmarks = fake_landmarks(478)
+    expected = [pack_to_landmark.format_landmark(lm).Landmark for lm in raw_landmarks]
+    out = np.empty((478, 4), dtype=np.float32)
+    packed = pack_to_landmark.pack_landmarks(raw_landmarks, out)
+    assert packed.values is out
+    np.testing.assert_allclose(packed.values, expected, rtol=1e-6)
+    assert pack_to_landmark.pack_landmarks(raw_landmarks).values.dtype == np.float32
+
+def test_pack_hand_landmarks_uses_handedness_score():
+    raw_landmarks = {'local_landmark': fake_landmarks(21, 1), 'world_landmark': fake_landmarks(21, 2), 'confidence': 0.75}
+    local, world = pack_to_landmark.pack_hand_landmarks(raw_landmarks)
+    np.testing.assert_allclose(local.values[:, 0:3], [(lm.x, lm.y, lm.z) for lm in raw_landmarks['local_landmark']], rtol=1e-6)
+    np.testing.assert_array_equal(world.values[:, 3], 0.75)
+
+def test_pack_landmarks_already_packed_into_array():
+    raw_landmarks = fake_landmarks(33, 3)
+    packed = pack_to_landmark.landmarks_to_array(raw_landmarks)
+    np.testing.assert_array_equal(pack_to_landmark.landmarks_to_array(packed), packed)
+    with_confidence = pack_to_landmark.landmarks_to_array_with_confidence(packed, 0.5)
+    np.testing.assert_array_equal(with_confidence[:, 0:3], packed[:, 0:3])
+    np.testing.assert_array_equal(with_confidence[:, 3], 0.5)
+    np.testing.assert_allclose(pack_to_landmark.l2(packed[0], packed[1]), pack_to_landmark.l2(raw_landmarks[0], raw_landmarks[1]), rtol=1e-6)
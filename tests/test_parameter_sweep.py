@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.filter.parameter_sweep import evaluate, sweep, apply_to_config
+from mediapipe_inferencer_core.landmark_recorder import LandmarkRecorder
+
+def record_noisy_hand(file_path, n_frames=120):
+    rng = np.random.default_rng(0)
+    recorder = LandmarkRecorder(file_path)
+    for frame in range(n_frames):
+        results = HolisticResults(None, None, None, frame / 60)
+        values = np.ones((21, 4))
+        values[:, 0:3] = 0.5 + 0.2 * np.sin(frame / 20) + rng.normal(0, 0.005, (21, 3))
+        if frame % 10 != 0:
+            results.hand.left.local = LandmarkList.from_array(values)
+        recorder.append(results)
+    recorder.save()
+
+def test_evaluate_trades_jitter_against_lag(tmp_path):
+    file_path = tmp_path / "recording.npz"
+    record_noisy_hand(file_path)
+    recording = np.load(file_path)
+    smooth = evaluate('one_euro', (0.05, 0.1, 1.0), recording['left_hand_local'], recording['time'], 2.0)
+    responsive = evaluate('one_euro', (10.0, 10.0, 1.0), recording['left_hand_local'], recording['time'], 2.0)
+    assert smooth[0] < responsive[0]
+    assert smooth[1] > responsive[1]
+
+def test_sweep_writes_best_parameters(tmp_path):
+    file_path = tmp_path / "recording.npz"
+    record_noisy_hand(file_path)
+    config = {"filter": {"default": {"d_min_cutoff": 3.0}, "hand": {"d_min_cutoff": 2.0}}}
+    results = sweep([str(file_path)], 'one_euro', {'min_cutoff': [0.05, 1.0], 'slope': [0.1]}, ['hand', 'face'],
+                    max_workers=1, config=config)
+    assert len(results['hand']) == 2 and results['face'] == []
+    # Parameters that are not swept are evaluated at their configured value and left untouched.
+    assert all(result.params[2] == 2.0 for result in results['hand'])
+    config = apply_to_config(config, 'one_euro', {'hand': results['hand'][0]})
+    assert config["filter"]["hand"]["slope"] == 0.1
+    assert config["filter"]["hand"]["d_min_cutoff"] == 2.0
+
+def test_sweep_rejects_unknown_parameters(tmp_path):
+    with pytest.raises(ValueError, match="min_cutof"):
+        sweep([str(tmp_path / "recording.npz")], 'one_euro', {'min_cutof': [0.05]}, ['hand'], max_workers=1)
+    with pytest.raises(ValueError, match="process_noise"):
+        sweep([str(tmp_path / "recording.npz")], 'one_euro', {'process_noise': [1.0]}, ['hand'], max_workers=1)
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip('mediapipe')
+from mediapipe_inferencer_core.detector import LandmarkDetector, ProcessDetector
+
+class EchoDetector(LandmarkDetector):
+    """Answer every frame with pose landmarks holding its first pixel, after `delay` seconds."""
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+    def inference(self, image, frame_timestamp_ms):
+        time.sleep(self.delay)
+        landmarks = np.full((33, 4), float(image.numpy_view()[0, 0, 0]))
+        self._save_results(SimpleNamespace(pose_landmarks=[landmarks], pose_world_landmarks=[]), None, frame_timestamp_ms)
+
+class FailingDetector(LandmarkDetector):
+    def __init__(self):
+        raise FileNotFoundError("missing.task")
+    def inference(self, image, frame_timestamp_ms):
+        pass
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+def test_results_match_their_frames_while_the_worker_lags():
+    detector = ProcessDetector(EchoDetector, 0.05, slots=2)
+    try:
+        for frame in range(6):
+            detector.submit(np.full((4, 4, 3), frame, dtype=np.uint8), 1000 + frame)
+            # Expired frames free no slot: only the frames the worker read do.
+            detector.expire(1000 + frame + 1)
+        wait_for(lambda: len(detector.history) >= 2)
+        time.sleep(0.2)
+        history = detector.history
+        assert all(results.pose_landmarks[0][0, 0] == timestamp_ms - 1000 for timestamp_ms, results in history)
+    finally:
+        detector.close()
+
+def test_start_up_error_is_raised():
+    with pytest.raises(FileNotFoundError):
+        ProcessDetector(FailingDetector)
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+import numpy as np
+from mediapipe_inferencer_core.packer.remap_landmarks import letterbox_region, remap_results, remap_tiled_results
+
+def test_letterboxed_landmarks_are_remapped_exactly():
+    content, region = letterbox_region((1280, 720), (640, 640))
+    assert content == (0, 140, 640, 360)
+    # Corners of the frame content. The content spans the whole width, so depth keeps its scale.
+    landmarks = np.array([[0.0, 140 / 640, 0.5, 1.0], [1.0, 500 / 640, 0.0, 1.0]])
+    results = remap_results(SimpleNamespace(pose_landmarks=[landmarks]), region, (1280, 720))
+    np.testing.assert_allclose(results.pose_landmarks[0], [[0.0, 0.0, 0.5, 1.0], [1.0, 1.0, 0.0, 1.0]])
+
+def test_rounded_letterbox_is_remapped_exactly():
+    # 1000 x 333 into 300 x 300 rounds the content height to 100 px.
+    (x, y, width, height), region = letterbox_region((1000, 333), (300, 300))
+    corners = np.array([[x / 300, y / 300, 0.0, 1.0], [(x + width) / 300, (y + height) / 300, 0.0, 1.0]])
+    results = remap_results(SimpleNamespace(face_landmarks=[corners]), region, (1000, 333))
+    np.testing.assert_allclose(results.face_landmarks[0][:, 0:2], [[0.0, 0.0], [1.0, 1.0]])
+
+def test_tiled_landmarks_are_remapped_by_their_tile():
+    # Two crops of different size, resized to tiles of the same size placed side by side.
+    regions = [(100, 200, 100, 100), (900, 300, 200, 200)]
+    left = np.array([[0.0, 0.0, 0.1, 1.0], [0.5, 1.0, 0.2, 1.0]])
+    right = np.array([[0.5, 0.0, 0.1, 1.0], [1.0, 0.5, 0.2, 1.0]])
+    results = remap_tiled_results(SimpleNamespace(hand_landmarks=[left, right]), regions, (1280, 720))
+    np.testing.assert_allclose(results.hand_landmarks[0][:, 0:2], [[100 / 1280, 200 / 720], [200 / 1280, 300 / 720]])
+    np.testing.assert_allclose(results.hand_landmarks[0][:, 2], [0.1 * 200 / 1280, 0.2 * 200 / 1280])
+    np.testing.assert_allclose(results.hand_landmarks[1][:, 0:2], [[900 / 1280, 300 / 720], [1100 / 1280, 400 / 720]])
+    np.testing.assert_allclose(results.hand_landmarks[1][:, 2], [0.1 * 400 / 1280, 0.2 * 400 / 1280])
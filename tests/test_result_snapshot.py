@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+import numpy as np
+from mediapipe_inferencer_core.data_class import HolisticResults, LandmarkList
+from mediapipe_inferencer_core.network.holistic_pose_sender import transform_coordinate
+
+def fake_landmarks(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in rng.random((n, 4)).tolist()]
+
+def make_results():
+    raw_pose = SimpleNamespace(pose_landmarks=[fake_landmarks(33, 1)], pose_world_landmarks=[fake_landmarks(33, 2)])
+    return HolisticResults(raw_pose, None, None, 1.0)
+
+def test_packed_landmarks_are_read_only():
+    results = make_results()
+    assert not results.pose.world.values.flags.writeable
+    assert not results.pose.local.values.flags.writeable
+
+def test_snapshot_shares_arrays_until_reassigned():
+    results = make_results()
+    snapshot = results.snapshot()
+    assert snapshot.time == results.time
+    assert snapshot.pose.world is results.pose.world
+    snapshot.pose.world = transform_coordinate(snapshot.pose.world)
+    assert snapshot.pose.world is not results.pose.world
+    np.testing.assert_allclose(snapshot.pose.world.values[:, 0:3], -results.pose.world.values[:, 0:3])
+    np.testing.assert_array_equal(snapshot.pose.world.values[:, 3], results.pose.world.values[:, 3])
+    assert snapshot.hand.left is not None and snapshot.hand.left.world is None
+
+def test_transform_coordinate_keeps_dtype():
+    landmarks = LandmarkList.from_array(np.ones((21, 4), dtype=np.float32))
+    assert transform_coordinate(landmarks).values.dtype == np.float32
+
+def test_from_parts_shares_packed_parts():
+    results = make_results()
+    combined = HolisticResults.from_parts(pose=results.pose, time_s=2.0)
+    assert combined.time == 2.0
+    assert combined.pose.local is results.pose.local
+    assert combined.face.landmarks is None and combined.hand.right.world is None
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+pytest.importorskip('mediapipe')
+from mediapipe_inferencer_core.detector import LandmarkDetector, RoiDetector, HAND_POSE_LANDMARKS
+
+class FakeDetector(LandmarkDetector):
+    takes_mp_image = False
+    def __init__(self):
+        super().__init__()
+        self.images = []
+    def inference(self, image, frame_timestamp_ms):
+        self.images.append(image)
+    def callback(self, raw, timestamp_ms):
+        self._save_results(raw, None, timestamp_ms)
+
+def make_raw_pose(points, visibility=1.0):
+    landmarks = np.zeros((33, 4))
+    # Consecutive landmarks from the left wrist (15): left and right wrist, left and right pinky, ...
+    hand_points = slice(15, 15 + len(points))
+    landmarks[hand_points, 0:2] = points
+    landmarks[hand_points, 3] = visibility
+    return SimpleNamespace(pose_landmarks=[landmarks], pose_world_landmarks=[landmarks])
+
+def make_raw_hand(local):
+    return SimpleNamespace(hand_landmarks=[local], hand_world_landmarks=[local.copy()],
+                           handedness=[[SimpleNamespace(category_name='Left', score=0.9)]])
+
+IMAGE = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+def test_hand_landmarks_are_remapped_from_the_crop_to_the_frame():
+    pose, hand = FakeDetector(), FakeDetector()
+    roi = RoiDetector(hand, pose, HAND_POSE_LANDMARKS, padding=0.5, input_size=64)
+    pose.callback(make_raw_pose([(0.5, 0.5), (0.55, 0.5)]), 1000)
+    roi.submit(IMAGE, 1033)
+    assert hand.images[-1].shape == (64, 64, 3)
+
+    # The crops of the wrists overlap, so one crop covers both: they span 64 px, padded to a 128 px square.
+    local = np.array([[0.0, 0.0, 0.1, 0.0], [1.0, 1.0, 0.2, 0.0]])
+    hand.callback(make_raw_hand(local), 1033)
+    assert roi.pending == []
+    remapped = roi.results.hand_landmarks[0]
+    np.testing.assert_allclose(remapped[:, 0], [(672 - 64) / 1280, (672 + 64) / 1280])
+    np.testing.assert_allclose(remapped[:, 1], [(360 - 64) / 720, (360 + 64) / 720])
+    np.testing.assert_allclose(remapped[:, 2], [0.1 * 128 / 1280, 0.2 * 128 / 1280])
+    np.testing.assert_allclose(roi.results.hand_world_landmarks[0][:, 0:3], local[:, 0:3], rtol=1e-6)
+
+def test_full_frame_without_visible_pose_landmarks():
+    pose, hand = FakeDetector(), FakeDetector()
+    roi = RoiDetector(hand, pose, HAND_POSE_LANDMARKS)
+    roi.submit(IMAGE, 1000)
+    pose.callback(make_raw_pose([(0.5, 0.5)], visibility=0.1), 1000)
+    roi.submit(IMAGE, 1033)
+    assert [image.shape for image in hand.images] == [IMAGE.shape, IMAGE.shape]
+
+    local = np.array([[0.25, 0.75, 0.1, 0.0]])
+    hand.callback(make_raw_hand(local), 1033)
+    np.testing.assert_allclose(roi.results.hand_landmarks[0][:, 0:3], local[:, 0:3], rtol=1e-6)
+    assert roi.counts['dropped'] == 1
+
+def test_wrists_of_spread_arms_are_cropped_side_by_side():
+    pose, hand = FakeDetector(), FakeDetector()
+    roi = RoiDetector(hand, pose, HAND_POSE_LANDMARKS, input_size=64)
+    pose.callback(make_raw_pose([(0.125, 0.5), (0.875, 0.5)]), 1000)
+    roi.submit(IMAGE, 1033)
+    assert hand.images[-1].shape == (64, 128, 3)
+
+    # Each wrist gets a crop of the minimum size (72 px), and each hand is remapped from its own tile.
+    left, right = np.array([[0.25, 0.5, 0.0, 0.0]]), np.array([[0.75, 0.5, 0.0, 0.0]])
+    raw = SimpleNamespace(hand_landmarks=[left, right], hand_world_landmarks=[left.copy(), right.copy()],
+                          handedness=[[SimpleNamespace(category_name=name, score=0.9)] for name in ('Left', 'Right')])
+    hand.callback(raw, 1033)
+    np.testing.assert_allclose(roi.results.hand_landmarks[0][:, 0:2], [[0.125, 0.5]], rtol=1e-6)
+    np.testing.assert_allclose(roi.results.hand_landmarks[1][:, 0:2], [[0.875, 0.5]], rtol=1e-6)
@@ -0,0 +1,14 @@
+import numpy as np
+from mediapipe_inferencer_core.shared_frame_ring import SharedFrameRing
+
+def test_attached_ring_reads_written_frames():
+    ring = SharedFrameRing((4, 6, 3), 2)
+    attached = SharedFrameRing(ring.shape, ring.slots, ring.name)
+    try:
+        image = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+        ring.write(1, image)
+        np.testing.assert_array_equal(attached.frame(1), image)
+        assert attached.slots == 2
+    finally:
+        attached.close()
+        ring.close()